@@ -11,18 +11,19 @@
     python -m cli.main --trace --trace-output ./trace.html "分析热点"  # 保存追踪报告
 """
 
+from __future__ import annotations
+
 import argparse
+import hashlib
 import sys
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
-from src.agent import create_news_agent
-from src.config import load_settings
-from src.utils.callbacks import get_default_callbacks
-from src.utils.logger import logger, set_verbose
-from src.utils.templates import format_markdown_report, format_simple_output
-from src.utils.tracer import create_tracing_callback, AgentTracer, RichAgentCallback
+# Agent/LangChain 相关模块较重，延迟到参数解析成功后再导入，
+# 使 --help 和参数错误无需加载 langchain/deepagents
+if TYPE_CHECKING:
+    from src.utils.tracer import AgentTracer
 
 
 def parse_args() -> argparse.Namespace:
@@ -156,10 +157,17 @@ def run_agent(
     Returns:
         (Agent 运行结果, 追踪器) 元组
     """
+    from src.agent import create_news_agent
+    from src.config import get_settings
+    from src.utils.callbacks import get_default_callbacks
+    from src.utils.logger import logger
+    from src.utils.paths import ensure_dir
+    from src.utils.tracer import create_tracing_callback
+
     tracer: Optional[AgentTracer] = None
     
     logger.info(f"正在加载配置...")
-    config = load_settings()
+    config = get_settings()
     
     # 构建完整的查询（如果指定了领域）
     full_query = query
@@ -171,7 +179,6 @@ def run_agent(
     # TODO: 如果需要 model_override，这里需要创建 ChatModel 实例
     if checkpoint:
         from src.agent.master import create_news_agent_with_checkpointing
-        import hashlib
 
         # 默认使用 NEWS_AGENT_FS_BASE（config.filesystem.base_path）来放 checkpoints
         resolved_checkpoint_dir = checkpoint_dir
@@ -182,6 +189,7 @@ def run_agent(
         resolved_thread_id = thread_id
         if not resolved_thread_id:
             full_key = full_query.encode("utf-8")
+            # 保持 sha1 前 10 位的既有格式，旧版本保存的 checkpoint 才能按原 thread_id 续跑
             resolved_thread_id = "cli-" + hashlib.sha1(full_key).hexdigest()[:10]
             logger.info(f"未提供 --thread-id，自动生成: {resolved_thread_id}")
 
@@ -196,9 +204,7 @@ def run_agent(
     logger.info(f"开始分析查询: {query}")
     logger.info("=" * 60)
     
-    # 获取回调处理器
-    callbacks = []
-    
+    # 获取回调处理器（每次运行新建：回调会记录步骤计数等运行状态，不能跨运行复用）
     if trace:
         # 使用可视化追踪
         callback, tracer = create_tracing_callback(
@@ -206,7 +212,7 @@ def run_agent(
             show_input=trace_input,
             show_output=trace_output_detail,
         )
-        callbacks.append(callback)
+        callbacks = [callback]
         logger.info("📊 已启用可视化追踪")
     else:
         # 使用默认回调
@@ -235,7 +241,7 @@ def run_agent(
         # 保存追踪报告
         if trace_output:
             trace_path = Path(trace_output)
-            trace_path.parent.mkdir(parents=True, exist_ok=True)
+            ensure_dir(trace_path.parent)
             
             if trace_path.suffix == ".json":
                 tracer.export_json(str(trace_path))
@@ -253,7 +259,15 @@ def run_agent(
 def main():
     """主函数"""
     args = parse_args()
-    
+
+    from src.utils.logger import logger, set_verbose
+    from src.utils.paths import ensure_dir
+    from src.utils.templates import (
+        extract_report_content,
+        format_simple_output,
+        iter_report_sections,
+    )
+
     # 设置日志级别
     set_verbose(args.verbose)
     
@@ -278,26 +292,32 @@ def main():
         
         logger.info(f"总耗时: {duration:.2f} 秒")
         
+        # 只遍历一次结果消息，报告和终端预览共用
+        content = extract_report_content(result)
+        
         # 输出结果
         if args.output:
             # 输出到文件
             output_path = Path(args.output)
-            output_path.parent.mkdir(parents=True, exist_ok=True)
-            
-            report = format_markdown_report(
-                query=args.query,
-                result=result,
-                generation_time=end_time,
-            )
+            ensure_dir(output_path.parent)
             
-            output_path.write_text(report, encoding="utf-8")
+            # 逐段写入文件，避免在内存中拼接完整报告
+            with output_path.open("w", encoding="utf-8", buffering=1 << 16) as f:
+                f.writelines(
+                    iter_report_sections(
+                        query=args.query,
+                        result=result,
+                        generation_time=end_time,
+                        content=content,
+                    )
+                )
             logger.success(f"报告已保存到: {output_path}")
             
             # 也在终端显示简要内容
             print("\n" + "=" * 60)
             print("报告预览:")
             print("=" * 60)
-            print(format_simple_output(result))
+            print(format_simple_output(result, content=content))
             print("=" * 60)
             print(f"\n完整报告已保存到: {output_path}")
         else:
@@ -305,7 +325,7 @@ def main():
             print("\n" + "=" * 60)
             print("分析结果:")
             print("=" * 60)
-            print(format_simple_output(result))
+            print(format_simple_output(result, content=content))
             print("=" * 60)
         
         return 0
@@ -3,23 +3,47 @@
 提供 Agent 创建和配置功能：
 - master: MasterAgent 创建
 - subagents: 专家 SubAgent 配置
-- council: 专家委员会协作机制
+- council: 专家委员会协作机制（按需加载）
 """
 
+from importlib import import_module
+from typing import Any
+
 from .master import create_news_agent
 from .subagents import get_subagent_configs
-from .council import (
-    CROSS_REVIEW_MATRIX,
-    EXPERT_DESCRIPTIONS,
-    CrossReviewResult,
-    DiscussionPoint,
-    ExpertOutput,
-    Grade,
-    ReviewType,
-    generate_chairman_synthesis_prompt,
-    generate_cross_review_prompt,
-    generate_discussion_prompt,
-)
+
+# 专家委员会相关符号在首次访问时才导入（PEP 562）
+_LAZY_EXPORTS = {
+    "CROSS_REVIEW_MATRIX": "council",
+    "EXPERT_DESCRIPTIONS": "council",
+    "REVIEW_PAIRS": "council",
+    "REVIEWER_TO_TARGETS": "council",
+    "CrossReviewResult": "council",
+    "DiscussionPoint": "council",
+    "ExpertOutput": "council",
+    "Grade": "council",
+    "ReviewEdge": "council",
+    "ReviewType": "council",
+    "generate_batch_cross_review_prompt": "council",
+    "generate_chairman_synthesis_prompt": "council",
+    "generate_cross_review_prompt": "council",
+    "generate_discussion_prompt": "council",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *_LAZY_EXPORTS])
+
 
 __all__ = [
     # Master agent
@@ -29,11 +53,15 @@ __all__ = [
     # Expert council
     "CROSS_REVIEW_MATRIX",
     "EXPERT_DESCRIPTIONS",
+    "REVIEW_PAIRS",
+    "REVIEWER_TO_TARGETS",
     "CrossReviewResult",
     "DiscussionPoint",
     "ExpertOutput",
     "Grade",
+    "ReviewEdge",
     "ReviewType",
+    "generate_batch_cross_review_prompt",
     "generate_chairman_synthesis_prompt",
     "generate_cross_review_prompt",
     "generate_discussion_prompt",
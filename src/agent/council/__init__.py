@@ -9,14 +9,18 @@ from .matrix import (
     # Enums and data classes
     Grade,
     ReviewType,
+    ReviewEdge,
     ExpertOutput,
     CrossReviewResult,
     DiscussionPoint,
     # Matrix and descriptions
     CROSS_REVIEW_MATRIX,
+    REVIEW_PAIRS,
+    REVIEWER_TO_TARGETS,
     EXPERT_DESCRIPTIONS,
     # Prompt generators
     generate_cross_review_prompt,
+    generate_batch_cross_review_prompt,
     generate_discussion_prompt,
     generate_chairman_synthesis_prompt,
 )
@@ -25,14 +29,18 @@ __all__ = [
     # Enums and data classes
     "Grade",
     "ReviewType",
+    "ReviewEdge",
     "ExpertOutput",
     "CrossReviewResult",
     "DiscussionPoint",
     # Matrix and descriptions
     "CROSS_REVIEW_MATRIX",
+    "REVIEW_PAIRS",
+    "REVIEWER_TO_TARGETS",
     "EXPERT_DESCRIPTIONS",
     # Prompt generators
     "generate_cross_review_prompt",
+    "generate_batch_cross_review_prompt",
     "generate_discussion_prompt",
     "generate_chairman_synthesis_prompt",
 ]
@@ -6,9 +6,11 @@
 为异质专家（不同职责）设计的交叉评审与共识讨论机制。
 """
 
+import string
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Set, Tuple
 
 
 class ReviewType(Enum):
@@ -30,15 +32,7 @@ class Grade(Enum):
     @classmethod
     def from_string(cls, s: str) -> "Grade":
         """从字符串解析等级"""
-        s = s.upper().strip()
-        if s in ("A", "A+", "A-"):
-            return cls.A
-        elif s in ("B", "B+", "B-"):
-            return cls.B
-        elif s in ("C", "C+", "C-"):
-            return cls.C
-        else:
-            return cls.D
+        return _GRADE_ALIASES.get(s.upper().strip(), cls.D)
     
     def is_passing(self) -> bool:
         """是否及格（C 及以上）"""
@@ -49,7 +43,15 @@ class Grade(Enum):
         return self in (Grade.C, Grade.D)
 
 
-@dataclass
+# 等级字符串 -> Grade，未收录的写法按 D 处理
+_GRADE_ALIASES: Dict[str, Grade] = {
+    f"{grade.value}{suffix}": grade
+    for grade in (Grade.A, Grade.B, Grade.C)
+    for suffix in ("", "+", "-")
+}
+
+
+@dataclass(slots=True)
 class ExpertOutput:
     """专家输出结果"""
     expert_name: str
@@ -58,7 +60,7 @@ class ExpertOutput:
     metadata: Dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class CrossReviewResult:
     """交叉评审结果"""
     reviewer: str
@@ -70,7 +72,15 @@ class CrossReviewResult:
     agreement_points: List[str]
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
+class ReviewEdge:
+    """评审关系：reviewer 从 review_types 维度评审某位专家"""
+    reviewer: str
+    review_types: Tuple[ReviewType, ...]
+    focus: str
+
+
+@dataclass(slots=True)
 class DiscussionPoint:
     """讨论要点"""
     topic: str
@@ -85,80 +95,113 @@ class DiscussionPoint:
 # 交叉评审矩阵 - 定义哪位专家应该评审哪位专家的哪些方面
 # =============================================================================
 
-CROSS_REVIEW_MATRIX = {
+CROSS_REVIEW_MATRIX: Mapping[str, Tuple[ReviewEdge, ...]] = MappingProxyType({
     # summarizer 被以下专家评审
-    "summarizer": [
-        {
-            "reviewer": "fact_checker",
-            "review_types": [ReviewType.ACCURACY],
-            "focus": "摘要中的事实声明是否准确？关键数据是否正确？"
-        },
-        {
-            "reviewer": "researcher",
-            "review_types": [ReviewType.COMPLETENESS],
-            "focus": "摘要是否遗漏了重要的背景信息或上下文？"
-        },
-        {
-            "reviewer": "impact_assessor",
-            "review_types": [ReviewType.COMPLETENESS],
-            "focus": "摘要是否涵盖了影响分析所需的关键要素？"
-        },
-    ],
+    "summarizer": (
+        ReviewEdge(
+            reviewer="fact_checker",
+            review_types=(ReviewType.ACCURACY,),
+            focus="摘要中的事实声明是否准确？关键数据是否正确？",
+        ),
+        ReviewEdge(
+            reviewer="researcher",
+            review_types=(ReviewType.COMPLETENESS,),
+            focus="摘要是否遗漏了重要的背景信息或上下文？",
+        ),
+        ReviewEdge(
+            reviewer="impact_assessor",
+            review_types=(ReviewType.COMPLETENESS,),
+            focus="摘要是否涵盖了影响分析所需的关键要素？",
+        ),
+    ),
     
     # fact_checker 被以下专家评审
-    "fact_checker": [
-        {
-            "reviewer": "researcher",
-            "review_types": [ReviewType.EVIDENCE, ReviewType.COMPLETENESS],
-            "focus": "核查是否涵盖所有关键声明？历史数据引用是否准确？"
-        },
-        {
-            "reviewer": "summarizer",
-            "review_types": [ReviewType.CONSISTENCY],
-            "focus": "核查结果与原始摘要是否一致？是否有矛盾？"
-        },
-    ],
+    "fact_checker": (
+        ReviewEdge(
+            reviewer="researcher",
+            review_types=(ReviewType.EVIDENCE, ReviewType.COMPLETENESS),
+            focus="核查是否涵盖所有关键声明？历史数据引用是否准确？",
+        ),
+        ReviewEdge(
+            reviewer="summarizer",
+            review_types=(ReviewType.CONSISTENCY,),
+            focus="核查结果与原始摘要是否一致？是否有矛盾？",
+        ),
+    ),
     
     # researcher 被以下专家评审
-    "researcher": [
-        {
-            "reviewer": "fact_checker",
-            "review_types": [ReviewType.ACCURACY, ReviewType.EVIDENCE],
-            "focus": "背景信息是否准确？来源是否可靠？"
-        },
-        {
-            "reviewer": "impact_assessor",
-            "review_types": [ReviewType.COMPLETENESS, ReviewType.LOGIC],
-            "focus": "背景是否为影响分析提供了足够支撑？历史案例是否相关？"
-        },
-    ],
+    "researcher": (
+        ReviewEdge(
+            reviewer="fact_checker",
+            review_types=(ReviewType.ACCURACY, ReviewType.EVIDENCE),
+            focus="背景信息是否准确？来源是否可靠？",
+        ),
+        ReviewEdge(
+            reviewer="impact_assessor",
+            review_types=(ReviewType.COMPLETENESS, ReviewType.LOGIC),
+            focus="背景是否为影响分析提供了足够支撑？历史案例是否相关？",
+        ),
+    ),
     
     # impact_assessor 被以下专家评审
-    "impact_assessor": [
-        {
-            "reviewer": "researcher",
-            "review_types": [ReviewType.EVIDENCE, ReviewType.LOGIC],
-            "focus": "影响预测是否有历史依据？推理逻辑是否合理？"
-        },
-        {
-            "reviewer": "fact_checker",
-            "review_types": [ReviewType.ACCURACY, ReviewType.LOGIC],
-            "focus": "预测基于的前提是否经过验证？因果关系是否成立？"
-        },
-    ],
-}
+    "impact_assessor": (
+        ReviewEdge(
+            reviewer="researcher",
+            review_types=(ReviewType.EVIDENCE, ReviewType.LOGIC),
+            focus="影响预测是否有历史依据？推理逻辑是否合理？",
+        ),
+        ReviewEdge(
+            reviewer="fact_checker",
+            review_types=(ReviewType.ACCURACY, ReviewType.LOGIC),
+            focus="预测基于的前提是否经过验证？因果关系是否成立？",
+        ),
+    ),
+})
+
+
+def _build_review_indices() -> Tuple[
+    Tuple[Tuple[str, str, Tuple[ReviewType, ...], str], ...],
+    Mapping[str, Tuple[Tuple[str, Tuple[ReviewType, ...], str], ...]],
+]:
+    """一次遍历评审矩阵，构建评审对列表和评审者反向索引
+
+    跳过自评以及重复的 (reviewer, reviewee) 组合（保留首次出现），避免多余的模型调用。
+    """
+    pairs: List[Tuple[str, str, Tuple[ReviewType, ...], str]] = []
+    by_reviewer: Dict[str, List[Tuple[str, Tuple[ReviewType, ...], str]]] = {}
+    seen: Set[Tuple[str, str]] = set()
+
+    for reviewee, edges in CROSS_REVIEW_MATRIX.items():
+        for edge in edges:
+            key = (edge.reviewer, reviewee)
+            if edge.reviewer == reviewee or key in seen:
+                continue
+            seen.add(key)
+            pairs.append((edge.reviewer, reviewee, edge.review_types, edge.focus))
+            by_reviewer.setdefault(edge.reviewer, []).append(
+                (reviewee, edge.review_types, edge.focus)
+            )
+
+    return tuple(pairs), MappingProxyType(
+        {reviewer: tuple(targets) for reviewer, targets in by_reviewer.items()}
+    )
+
+
+# (reviewer, reviewee, review_types, focus) 评审对，按矩阵定义顺序排列
+# REVIEWER_TO_TARGETS[reviewer] -> 该专家需要评审的 (reviewee, review_types, focus)
+REVIEW_PAIRS, REVIEWER_TO_TARGETS = _build_review_indices()
 
 
 # =============================================================================
 # 专家描述
 # =============================================================================
 
-EXPERT_DESCRIPTIONS = {
+EXPERT_DESCRIPTIONS: Mapping[str, str] = MappingProxyType({
     "summarizer": "你专注于提取核心要点和生成结构化摘要，擅长信息压缩和关键信息识别。",
     "fact_checker": "你专注于核查事实声明的真实性，擅长信息溯源和证据验证。",
     "researcher": "你专注于补充背景信息和关联历史事件，擅长构建完整的上下文。",
     "impact_assessor": "你专注于评估影响和预测趋势，擅长多维度分析和前瞻性判断。",
-}
+})
 
 
 # =============================================================================
@@ -257,6 +300,79 @@ CROSS_REVIEW_PROMPT_TEMPLATE = """你是 {reviewer_name}，现在需要从你的
 """
 
 
+BATCH_CROSS_REVIEW_PROMPT_TEMPLATE = """你是 {reviewer_name}，现在需要从你的专业角度依次评审以下 {reviewee_count} 位专家的分析结果。
+
+## 你的专业职责
+{reviewer_description}
+
+## 原始分析主题/素材：
+{original_context}
+
+---
+
+## 待评审内容
+
+{review_sections}
+
+---
+
+## 评审要求
+
+对每位专家分别从准确性、完整性、一致性、建议与改进四个维度评审，彼此独立给出等级。
+
+## 评审等级说明（A/B/C/D 四级制）
+
+| 等级 | 含义 | 标准 |
+|------|------|------|
+| **A** | 优秀 | 质量高，无明显问题，可直接采用 |
+| **B** | 良好 | 质量较好，有小问题但不影响整体 |
+| **C** | 及格 | 有明显问题，需要改进后才能采用 |
+| **D** | 不及格 | 存在严重问题，需要重新分析 |
+
+---
+
+## 输出格式
+
+请以 JSON 格式输出，reviews 的键为被评审专家名称（{reviewee_names}）：
+
+```json
+{{
+  "reviews": {{
+    "<被评审专家名称>": {{
+      "overall_grade": "B",
+      "issues": [
+        {{
+          "severity": "high/medium/low",
+          "description": "具体问题描述",
+          "location": "问题出现的位置/段落"
+        }}
+      ],
+      "agreement_points": ["认同的观点"],
+      "suggestions": ["改进建议"],
+      "conflicts_with_my_analysis": [
+        {{
+          "topic": "冲突主题",
+          "their_position": "对方观点",
+          "my_position": "我的观点",
+          "evidence": "我的依据"
+        }}
+      ]
+    }}
+  }}
+}}
+```
+"""
+
+
+BATCH_REVIEW_SECTION_TEMPLATE = """### 评审对象：{reviewee_name}
+
+**评审重点**：{review_focus}
+
+**{reviewee_name} 的分析结果**：
+{reviewee_output}
+"""
+
+
 CONSENSUS_DISCUSSION_PROMPT = """你是 {expert_name}，现在需要参与专家讨论以解决以下分歧。
 
 ## 讨论主题
@@ -336,6 +452,33 @@ CHAIRMAN_SYNTHESIS_PROMPT = """你是专家委员会主管（Chairman），需
 """
 
 
+# 模板在导入时预解析为 (字面文本, 字段名) 片段，渲染时无需重复解析格式串和 {{ }} 转义
+_TemplateSegments = Tuple[Tuple[str, Optional[str]], ...]
+
+
+def _compile_template(template: str) -> _TemplateSegments:
+    """将 str.format 风格模板解析为片段序列"""
+    return tuple(
+        (literal, field_name)
+        for literal, field_name, _spec, _conversion in string.Formatter().parse(template)
+    )
+
+
+def _render_template(segments: _TemplateSegments, values: Mapping[str, Any]) -> str:
+    """按片段拼接模板，等价于 template.format_map(values)"""
+    return "".join(
+        literal + str(values[field_name]) if field_name is not None else literal
+        for literal, field_name in segments
+    )
+
+
+_CROSS_REVIEW_SEGMENTS = _compile_template(CROSS_REVIEW_PROMPT_TEMPLATE)
+_BATCH_CROSS_REVIEW_SEGMENTS = _compile_template(BATCH_CROSS_REVIEW_PROMPT_TEMPLATE)
+_BATCH_REVIEW_SECTION_SEGMENTS = _compile_template(BATCH_REVIEW_SECTION_TEMPLATE)
+_DISCUSSION_SEGMENTS = _compile_template(CONSENSUS_DISCUSSION_PROMPT)
+_CHAIRMAN_SEGMENTS = _compile_template(CHAIRMAN_SYNTHESIS_PROMPT)
+
+
 # =============================================================================
 # Prompt 生成函数
 # =============================================================================
@@ -348,13 +491,53 @@ def generate_cross_review_prompt(
     review_focus: str,
 ) -> str:
     """生成交叉评审的 Prompt"""
-    return CROSS_REVIEW_PROMPT_TEMPLATE.format(
-        reviewer_name=reviewer,
-        reviewee_name=reviewee,
-        reviewer_description=EXPERT_DESCRIPTIONS.get(reviewer, ""),
-        review_focus=review_focus,
-        reviewee_output=reviewee_output,
-        original_context=original_context,
+    return _render_template(
+        _CROSS_REVIEW_SEGMENTS,
+        {
+            "reviewer_name": reviewer,
+            "reviewee_name": reviewee,
+            "reviewer_description": EXPERT_DESCRIPTIONS.get(reviewer, ""),
+            "review_focus": review_focus,
+            "reviewee_output": reviewee_output,
+            "original_context": original_context,
+        },
+    )
+
+
+def generate_batch_cross_review_prompt(
+    reviewer: str,
+    targets: List[Tuple[str, str, str]],
+    original_context: str,
+) -> str:
+    """生成一次评审多位专家的交叉评审 Prompt
+
+    Args:
+        reviewer: 评审专家
+        targets: (reviewee, reviewee_output, review_focus) 列表
+        original_context: 原始分析素材
+    """
+    review_sections = "\n".join(
+        _render_template(
+            _BATCH_REVIEW_SECTION_SEGMENTS,
+            {
+                "reviewee_name": reviewee,
+                "review_focus": review_focus,
+                "reviewee_output": reviewee_output,
+            },
+        )
+        for reviewee, reviewee_output, review_focus in targets
+    )
+
+    return _render_template(
+        _BATCH_CROSS_REVIEW_SEGMENTS,
+        {
+            "reviewer_name": reviewer,
+            "reviewee_count": len(targets),
+            "reviewer_description": EXPERT_DESCRIPTIONS.get(reviewer, ""),
+            "original_context": original_context,
+            "review_sections": review_sections,
+            "reviewee_names": "、".join(reviewee for reviewee, _, _ in targets),
+        },
     )
 
 
@@ -365,16 +548,19 @@ def generate_discussion_prompt(
     positions: Dict[str, str],
 ) -> str:
     """生成共识讨论的 Prompt"""
-    positions_text = "\n".join([
-        f"**{expert}**: {position}" 
+    positions_text = "\n".join(
+        f"**{expert}**: {position}"
         for expert, position in positions.items()
-    ])
+    )
     
-    return CONSENSUS_DISCUSSION_PROMPT.format(
-        expert_name=expert_name,
-        discussion_topic=discussion_topic,
-        conflict_description=conflict_description,
-        positions=positions_text,
+    return _render_template(
+        _DISCUSSION_SEGMENTS,
+        {
+            "expert_name": expert_name,
+            "discussion_topic": discussion_topic,
+            "conflict_description": conflict_description,
+            "positions": positions_text,
+        },
     )
 
 
@@ -387,37 +573,44 @@ def generate_chairman_synthesis_prompt(
     discussion_results: str,
 ) -> str:
     """生成主管综合裁决的 Prompt"""
-    expert_outputs_text = "\n\n".join([
+    expert_outputs_text = "\n\n".join(
         f"### {expert}\n{output}"
         for expert, output in expert_outputs.items()
-    ])
+    )
     
-    issues_text = "\n".join([f"- {issue}" for issue in identified_issues])
+    issues_text = "\n".join(f"- {issue}" for issue in identified_issues)
     
-    conflicts_text = "\n".join([
+    conflicts_text = "\n".join(
         f"- **{c.get('topic', '未知主题')}**: {c.get('description', '')}"
         for c in conflicts
-    ])
+    )
     
-    return CHAIRMAN_SYNTHESIS_PROMPT.format(
-        original_task=original_task,
-        expert_outputs=expert_outputs_text,
-        cross_review_summary=cross_review_summary,
-        identified_issues=issues_text if issues_text else "无重大问题",
-        conflicts=conflicts_text if conflicts_text else "无明显分歧",
-        discussion_results=discussion_results if discussion_results else "专家已达成共识",
+    return _render_template(
+        _CHAIRMAN_SEGMENTS,
+        {
+            "original_task": original_task,
+            "expert_outputs": expert_outputs_text,
+            "cross_review_summary": cross_review_summary,
+            "identified_issues": issues_text if issues_text else "无重大问题",
+            "conflicts": conflicts_text if conflicts_text else "无明显分歧",
+            "discussion_results": discussion_results if discussion_results else "专家已达成共识",
+        },
     )
 
 
 __all__ = [
     "Grade",
     "ReviewType",
+    "ReviewEdge",
     "ExpertOutput",
     "CrossReviewResult",
     "DiscussionPoint",
     "CROSS_REVIEW_MATRIX",
+    "REVIEW_PAIRS",
+    "REVIEWER_TO_TARGETS",
     "EXPERT_DESCRIPTIONS",
     "generate_cross_review_prompt",
+    "generate_batch_cross_review_prompt",
     "generate_discussion_prompt",
     "generate_chairman_synthesis_prompt",
 ]
@@ -2,14 +2,17 @@
 
 from __future__ import annotations
 
+import sqlite3
 from datetime import datetime, timedelta
+from functools import lru_cache
+from pathlib import Path
 from typing import Any
 
 from deepagents import create_deep_agent
 from langchain_core.language_models import BaseChatModel
 from langchain_core.tools import BaseTool
 
-from ..config import AppConfig, create_chat_model, load_settings
+from ..config import AppConfig, create_chat_model, get_settings
 from ..prompts import MASTER_AGENT_SYSTEM_PROMPT
 from ..tools import (
     evaluate_credibility,
@@ -23,8 +26,11 @@ from ..tools import (
     search_github_trending,
     search_hackernews,
 )
+from ..utils.paths import ensure_dir
 from .subagents import get_subagent_configs
 
+_WEEKDAYS = ("星期一", "星期二", "星期三", "星期四", "星期五", "星期六", "星期日")
+
 
 def create_news_agent(
     config: AppConfig | None = None,
@@ -57,7 +63,7 @@ def create_news_agent(
         A configured DeepAgents agent instance.
     """
     if config is None:
-        config = load_settings()
+        config = get_settings()
 
     if current_datetime is None:
         current_datetime = datetime.now()
@@ -117,8 +123,15 @@ def create_news_agent(
 
 def format_datetime_context(dt: datetime) -> str:
     """Format datetime information for agent context in Chinese."""
-    weekdays = ["星期一", "星期二", "星期三", "星期四", "星期五", "星期六", "星期日"]
-    weekday = weekdays[dt.weekday()]
+    # Output has second resolution, so drop microseconds to share cache entries.
+    # Aware datetimes compare by UTC instant, so key on the naive wall-clock time
+    # to keep different time zones from sharing an entry.
+    return _format_datetime_context(dt.replace(microsecond=0, tzinfo=None))
+
+
+@lru_cache(maxsize=64)
+def _format_datetime_context(dt: datetime) -> str:
+    weekday = _WEEKDAYS[dt.weekday()]
 
     date_str = dt.strftime("%Y年%m月%d日")
     time_str = dt.strftime("%H:%M:%S")
@@ -153,23 +166,48 @@ def create_news_agent_with_checkpointing(
     Returns:
         A configured agent with checkpointing enabled.
     """
-    import sqlite3
-    from pathlib import Path
-
-    from langgraph.checkpoint.sqlite import SqliteSaver
-
     if checkpoint_dir is None:
         checkpoint_dir = "./data/checkpoints"
 
-    Path(checkpoint_dir).mkdir(parents=True, exist_ok=True)
+    ensure_dir(checkpoint_dir)
 
-    checkpoint_path = f"{checkpoint_dir}/agent_state.db"
-    conn = sqlite3.connect(checkpoint_path, check_same_thread=False)
-    checkpointer = SqliteSaver(conn)
+    checkpoint_path = str((Path(checkpoint_dir) / "agent_state.db").resolve())
+    checkpointer = _get_sqlite_checkpointer(checkpoint_path)
 
     return create_news_agent(checkpointer=checkpointer, **kwargs)
 
 
+# Checkpointers keyed by absolute database path, reused across agent creations
+_SQLITE_CHECKPOINTERS: dict[str, Any] = {}
+
+# WAL + NORMAL sync suits LangGraph's small, frequent state writes (WAL needs a local fs)
+_SQLITE_PRAGMAS = (
+    "journal_mode=WAL",
+    "synchronous=NORMAL",
+    "temp_store=MEMORY",
+    "mmap_size=268435456",
+    "cache_size=-65536",
+)
+
+
+def _get_sqlite_checkpointer(checkpoint_path: str) -> Any:
+    """Return a shared SqliteSaver for the database, opening and tuning it once."""
+    checkpointer = _SQLITE_CHECKPOINTERS.get(checkpoint_path)
+    if checkpointer is not None:
+        return checkpointer
+
+    # Optional checkpoint backend; only imported when checkpointing is used
+    from langgraph.checkpoint.sqlite import SqliteSaver
+
+    conn = sqlite3.connect(checkpoint_path, check_same_thread=False)
+    for pragma in _SQLITE_PRAGMAS:
+        conn.execute(f"PRAGMA {pragma}")
+
+    checkpointer = SqliteSaver(conn)
+    _SQLITE_CHECKPOINTERS[checkpoint_path] = checkpointer
+    return checkpointer
+
+
 __all__ = [
     "create_news_agent",
     "create_news_agent_with_checkpointing",
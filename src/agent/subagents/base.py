@@ -7,6 +7,38 @@ from typing import Any
 from langchain_core.messages import AIMessage, HumanMessage
 from langchain_core.runnables import RunnableConfig, RunnableLambda
 
+from ...config import AppConfig, create_chat_model
+
+# Exact-type lookup for the common message classes; subclasses fall back to isinstance
+_ROLE_BY_MESSAGE_TYPE: dict[type, str] = {HumanMessage: "user", AIMessage: "assistant"}
+
+
+def _message_role(msg: Any) -> str | None:
+    role = _ROLE_BY_MESSAGE_TYPE.get(type(msg))
+    if role is None:
+        if isinstance(msg, HumanMessage):
+            role = "user"
+        elif isinstance(msg, AIMessage):
+            role = "assistant"
+    return role
+
+
+def get_role_model(config: AppConfig, role: str) -> Any:
+    """
+    Return the chat model for a role.
+
+    ``create_chat_model`` caches clients, so roles that resolve to the same
+    ModelConfig and credentials share one client.
+
+    Args:
+        config: Application configuration.
+        role: Agent role passed to ``config.model_for_role``.
+
+    Returns:
+        A LangChain chat model instance.
+    """
+    return create_chat_model(config.model_for_role(role), config)
+
 
 def create_structured_runnable(
     model: Any,
@@ -25,24 +57,22 @@ def create_structured_runnable(
         A callable Runnable.
     """
     structured_model = model.with_structured_output(output_schema)
+    # The system prompt is fixed for the runnable's lifetime, so build its message once
+    system_message = {"role": "system", "content": system_prompt}
 
-    def invoke_fn(state: dict, config: RunnableConfig | None = None) -> dict:
-        messages = state.get("messages", [])
-
-        full_messages: list[dict[str, str]] = [
-            {"role": "system", "content": system_prompt}
-        ]
+    def build_messages(messages: list) -> list[dict[str, str]]:
+        full_messages: list[dict[str, str]] = [system_message]
 
         for msg in messages:
-            if isinstance(msg, HumanMessage):
-                full_messages.append({"role": "user", "content": msg.content})
-            elif isinstance(msg, AIMessage):
-                full_messages.append({"role": "assistant", "content": msg.content})
+            role = _message_role(msg)
+            if role is not None:
+                full_messages.append({"role": role, "content": msg.content})
             elif isinstance(msg, dict):
                 full_messages.append(msg)
 
-        result = structured_model.invoke(full_messages, config=config)
+        return full_messages
 
+    def build_response(messages: list, result: Any) -> dict:
         result_str = (
             result.model_dump_json(indent=2)
             if hasattr(result, "model_dump_json")
@@ -51,8 +81,20 @@ def create_structured_runnable(
 
         return {"messages": [*messages, AIMessage(content=result_str)]}
 
-    return RunnableLambda(invoke_fn)
+    def invoke_fn(state: dict, config: RunnableConfig | None = None) -> dict:
+        messages = state.get("messages", [])
+        result = structured_model.invoke(build_messages(messages), config=config)
+        return build_response(messages, result)
+
+    async def ainvoke_fn(state: dict, config: RunnableConfig | None = None) -> dict:
+        # Native async path, so concurrent subagent calls share one event loop
+        # instead of each holding a worker thread for the whole model round trip
+        messages = state.get("messages", [])
+        result = await structured_model.ainvoke(build_messages(messages), config=config)
+        return build_response(messages, result)
+
+    return RunnableLambda(invoke_fn, afunc=ainvoke_fn)
 
 
-__all__ = ["create_structured_runnable"]
+__all__ = ["create_structured_runnable", "get_role_model"]
 
@@ -10,64 +10,142 @@ Stages (stage 1 provided externally):
 from __future__ import annotations
 
 import asyncio
+import io
 import json
 import re
-from typing import Any
+import threading
+import weakref
+from collections import OrderedDict, defaultdict
+from collections.abc import Mapping
+from typing import Any, AsyncIterator, Awaitable, Callable, Coroutine, Iterator, TypeVar
+
+try:
+    # orjson ships with langsmith; fall back to the stdlib codec when absent
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
 
 from deepagents.middleware.subagents import CompiledSubAgent
 from langchain_core.messages import AIMessage
 from langchain_core.runnables import RunnableConfig, RunnableLambda
 
 from ..council import (
-    CROSS_REVIEW_MATRIX,
     EXPERT_DESCRIPTIONS,
+    REVIEW_PAIRS,
+    generate_batch_cross_review_prompt,
     generate_cross_review_prompt,
 )
-from ...config import AppConfig, create_chat_model
-from ...prompts.experts import (
-    EXPERT_SUPERVISOR_PROMPT,
-    FACT_CHECKER_PROMPT,
-    IMPACT_ASSESSOR_PROMPT,
-    RESEARCHER_PROMPT,
-    SUMMARIZER_PROMPT,
-)
+from ...config import AppConfig
+from ...prompts.experts import EXPERT_SUPERVISOR_PROMPT
+from .base import get_role_model
 
 
-_EXPERT_PROMPTS = {
-    "summarizer": SUMMARIZER_PROMPT,
-    "fact_checker": FACT_CHECKER_PROMPT,
-    "researcher": RESEARCHER_PROMPT,
-    "impact_assessor": IMPACT_ASSESSOR_PROMPT,
-    "expert_supervisor": EXPERT_SUPERVISOR_PROMPT,
+_EXPECTED_EXPERTS = ("summarizer", "fact_checker", "researcher", "impact_assessor")
+_EXPECTED_SET = frozenset(_EXPECTED_EXPERTS)
+
+# Council role -> model role passed to ``AppConfig.model_for_role``
+_COUNCIL_MODEL_ROLES = {
+    "summarizer": "summarizer",
+    "fact_checker": "fact_checker",
+    "researcher": "researcher",
+    "impact_assessor": "impact_assessor",
+    "expert_supervisor": "master",
 }
 
-_EXPECTED_EXPERTS = ("summarizer", "fact_checker", "researcher", "impact_assessor")
+# Stage 3 discusses at most this many conflicts, in matrix order
+_MAX_DISCUSSED_CONFLICTS = 3
+
+# Reviewer and chairman system messages never change, so each is built once
+_REVIEWER_SYSTEM_MESSAGES = {
+    name: {"role": "system", "content": EXPERT_DESCRIPTIONS.get(name, "")}
+    for name in _EXPECTED_EXPERTS
+}
+
+_CHAIRMAN_SYSTEM_MESSAGE = {"role": "system", "content": EXPERT_SUPERVISOR_PROMPT}
 
 _GRADE_VALUES = {"A": 4, "B": 3, "C": 2, "D": 1}
 
+# Expert output excerpt lengths: Stage 1 report vs. chairman prompt / consensus summary
+_REPORT_PREVIEW_CHARS = 500
+_CHAIRMAN_PREVIEW_CHARS = 800
+
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+_CODE_BLOCK_RE = re.compile(r"```(?:json)?\n(.*?)```", re.S)
+_JSON_GRADE_RE = re.compile(r'"overall_grade"\s*:\s*"([ABCD])"', re.IGNORECASE)
+_CN_GRADE_RE = re.compile(r'等级[：:]\s*([ABCD])', re.IGNORECASE)
+
+_T = TypeVar("_T")
+
+# Persistent event loop for synchronous council calls, started on first use
+_background_loop: asyncio.AbstractEventLoop | None = None
+_background_loop_lock = threading.Lock()
+
+
+def _get_background_loop() -> asyncio.AbstractEventLoop:
+    """Return the shared event loop running on a daemon thread."""
+    global _background_loop
+    with _background_loop_lock:
+        if _background_loop is None:
+            loop = asyncio.new_event_loop()
+            threading.Thread(
+                target=loop.run_forever,
+                name="expert-council-loop",
+                daemon=True,
+            ).start()
+            _background_loop = loop
+    return _background_loop
+
+
+def _run_coroutine_sync(coro: Coroutine[Any, Any, _T]) -> _T:
+    """
+    Run a coroutine to completion from synchronous code.
+
+    Unlike asyncio.run, this reuses one long-lived loop so model HTTP clients
+    keep their connection pools across calls, and it also works when the
+    caller is already inside a running loop.
+    """
+    future = asyncio.run_coroutine_threadsafe(coro, _get_background_loop())
+    return future.result()
+
 
 def _parse_json_payload(raw: str) -> dict[str, Any] | None:
     """Parse JSON from raw text, handling code blocks."""
-    candidates: list[str] = []
+    # Try the whole message first; fenced blocks are only scanned if that fails
     stripped = raw.strip()
-
     if stripped.startswith("{") and stripped.endswith("}"):
-        candidates.append(stripped)
-
-    for match in re.finditer(r"```(?:json)?\n(.*?)```", raw, re.S):
-        candidates.append(match.group(1).strip())
-
-    for candidate in candidates:
-        try:
-            payload = json.loads(candidate)
-            if isinstance(payload, dict):
+        payload = _loads_dict(stripped)
+        if payload is not None:
+            return payload
+
+    # Only scan for fenced blocks when a fence is present at all
+    if "```" in raw:
+        for match in _CODE_BLOCK_RE.finditer(raw):
+            payload = _loads_dict(match.group(1).strip())
+            if payload is not None:
                 return payload
-        except json.JSONDecodeError:
-            continue
 
     return None
 
 
+def _loads_dict(candidate: str) -> dict[str, Any] | None:
+    try:
+        payload = _json_loads(candidate)
+    except ValueError:
+        return None
+    return payload if isinstance(payload, dict) else None
+
+
+def _dump_review(review: dict) -> str:
+    """Pretty-print a parsed review, matching ``json.dumps(indent=2, ensure_ascii=False)``."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(review, option=orjson.OPT_INDENT_2).decode()
+        except TypeError:
+            pass
+    return json.dumps(review, ensure_ascii=False, indent=2)
+
+
 def _extract_expert_payload(raw: str) -> tuple[str, str, dict[str, str]] | None:
     """Extract task, context, and expert outputs from raw input."""
     payload = _parse_json_payload(raw)
@@ -111,13 +189,23 @@ def _extract_expert_payload(raw: str) -> tuple[str, str, dict[str, str]] | None:
 
 def _extract_grade(text: str) -> str:
     """Extract grade (A/B/C/D) from text."""
-    json_match = re.search(r'"overall_grade"\s*:\s*"([ABCD])"', text, re.IGNORECASE)
-    if json_match:
-        return json_match.group(1).upper()
-
-    grade_match = re.search(r'等级[：:]\s*([ABCD])', text, re.IGNORECASE)
-    if grade_match:
-        return grade_match.group(1).upper()
+    # Fast path: the prompts ask for a lowercase key, so anchor the match on it
+    key_index = text.find('"overall_grade"')
+    if key_index >= 0:
+        json_match = _JSON_GRADE_RE.match(text, key_index)
+        if json_match:
+            return json_match.group(1).upper()
+
+    # Any casing of the key contains "_", so prose without one skips the regex scan
+    if "_" in text:
+        json_match = _JSON_GRADE_RE.search(text)
+        if json_match:
+            return json_match.group(1).upper()
+
+    if "等级" in text:
+        grade_match = _CN_GRADE_RE.search(text)
+        if grade_match:
+            return grade_match.group(1).upper()
 
     return "B"
 
@@ -127,208 +215,560 @@ def _calculate_average_grade(grades: list[str]) -> str:
     if not grades:
         return "B"
 
-    avg = sum(_GRADE_VALUES.get(g, 3) for g in grades) / len(grades)
+    # Compare 2 * total with 2 * threshold * count to stay in integer arithmetic
+    doubled_total = 2 * sum(_GRADE_VALUES.get(g, 3) for g in grades)
+    count = len(grades)
 
-    if avg >= 3.5:
+    if doubled_total >= 7 * count:
         return "A"
-    if avg >= 2.5:
+    if doubled_total >= 5 * count:
         return "B"
-    if avg >= 1.5:
+    if doubled_total >= 3 * count:
         return "C"
     return "D"
 
 
+def _preview(text: str, limit: int) -> str:
+    """Truncate ``text`` to ``limit`` characters, marking the cut with an ellipsis."""
+    return text[:limit] + "..." if len(text) > limit else text
+
+
+def _review_pairs(expert_outputs: dict[str, str]) -> list[tuple[str, str, str]]:
+    """Return (reviewer, reviewee, focus) matrix edges whose experts both have outputs."""
+    # Matrix experts are all expected experts, so test pairs against this small set
+    available = _EXPECTED_SET.intersection(expert_outputs)
+    return [
+        (reviewer, reviewee, focus)
+        for reviewer, reviewee, _review_types, focus in REVIEW_PAIRS
+        if reviewee in available and reviewer in available
+    ]
+
+
+def _failed_review(reviewer: str, reviewee: str, error: BaseException) -> dict:
+    """Review record used when the reviewer's model call raised."""
+    return {
+        "reviewer": reviewer,
+        "reviewee": reviewee,
+        "grade": "C",
+        "content": f"评审失败: {error}",
+    }
+
+
+def _ignore_review(review: dict) -> None:
+    pass
+
+
+def _is_conflict(review: dict) -> bool:
+    return review.get("grade", "B") in ("C", "D")
+
+
+def _conflict_from_review(review: dict) -> dict:
+    return {
+        "topic": f"{review['reviewer']} 对 {review['reviewee']} 的评审",
+        "grade": review.get("grade", "B"),
+        "reviewer": review["reviewer"],
+        "reviewee": review["reviewee"],
+        "content": review.get("content", "")[:300],
+    }
+
+
+async def _collect_rebuttals(jobs: list[tuple[dict, Awaitable[Any]]]) -> str:
+    """Await rebuttal calls together and render them in conflict order."""
+    responses = await asyncio.gather(*(job for _, job in jobs), return_exceptions=True)
+
+    return "\n".join(
+        _format_rebuttal(conflict, response)
+        for (conflict, _job), response in zip(jobs, responses)
+    )
+
+
+def _build_rebuttal_prompt(conflict: dict) -> str:
+    """Ask the reviewed expert to answer a low-grade review."""
+    reviewee = conflict["reviewee"]
+    reviewer = conflict["reviewer"]
+    return f"""你是 {reviewee}，你的分析被 {reviewer} 评为 {conflict['grade']} 级。
+
+{reviewer} 的评审意见:
+{conflict['content']}
+
+请针对这些意见进行回应（200字内）。
+"""
+
+
+def _format_rebuttal(conflict: dict, response: Any) -> str:
+    """Render one Stage 3 discussion entry; ``response`` may be the raised exception."""
+    if isinstance(response, BaseException):
+        return f"\n### 分歧: {conflict['topic']}\n\n讨论失败: {response}\n"
+    return (
+        f"\n### 分歧: {conflict['topic']}\n\n"
+        f"**评审等级**: {conflict['grade']}\n\n"
+        f"**{conflict['reviewee']} 的回应**:\n{response.content}\n"
+    )
+
+
+class _RebuttalPipeline:
+    """Start Stage 3 rebuttals while Stage 2 reviews are still arriving.
+
+    Reviews are consumed in matrix order, so the conflicts started are exactly
+    the first ``_MAX_DISCUSSED_CONFLICTS`` that ``_identify_conflicts`` would
+    return, each launched as soon as its place in that order is settled.
+    """
+
+    def __init__(
+        self,
+        runner: ExpertCouncilRunner,
+        pairs: list[tuple[str, str, str]],
+        models: Mapping[str, Any],
+    ) -> None:
+        self._runner = runner
+        self._models = models
+        self._order = [(reviewer, reviewee) for reviewer, reviewee, _focus in pairs]
+        self._arrived: dict[tuple[str, str], dict] = {}
+        self._cursor = 0
+        self._selected = 0
+        self._jobs: list[tuple[dict, asyncio.Task]] = []
+
+    def add(self, review: dict) -> None:
+        self._arrived[(review["reviewer"], review["reviewee"])] = review
+        while self._cursor < len(self._order) and self._selected < _MAX_DISCUSSED_CONFLICTS:
+            current = self._arrived.get(self._order[self._cursor])
+            if current is None:
+                return
+            self._cursor += 1
+            if not _is_conflict(current):
+                continue
+            self._selected += 1
+            conflict = _conflict_from_review(current)
+            if self._models.get(conflict["reviewee"]):
+                self._jobs.append((conflict, asyncio.create_task(self._runner._rebut(conflict))))
+
+    async def collect(self) -> str:
+        return await _collect_rebuttals(self._jobs)
+
+
+def _build_consensus_summary(
+    expert_outputs: dict[str, str],
+    grade_summary: dict[str, list[str]],
+    average_grades: dict[str, str],
+) -> str:
+    """Build the Stage 4 verdict without the chairman model when experts agree."""
+    lines = [
+        "### 共识结论",
+        "",
+        "交叉评审未发现 C/D 级评价，各专家结论一致，以下为各专家要点汇总。",
+        "",
+        "| 专家 | 平均等级 | 评审数 |",
+        "| --- | --- | --- |",
+    ]
+    lines.extend(
+        f"| {reviewee} | {average_grades[reviewee]} | {len(grades)} |"
+        for reviewee, grades in grade_summary.items()
+    )
+    lines.append("")
+    for expert in _EXPECTED_EXPERTS:
+        output = expert_outputs.get(expert)
+        if output:
+            preview = _preview(output, _CHAIRMAN_PREVIEW_CHARS)
+            lines.extend((f"#### {expert}", preview, ""))
+    return "\n".join(lines)
+
+
+class _LazyRoleModels(Mapping[str, Any]):
+    """Council role -> chat model, built on first use so absent experts cost nothing."""
+
+    def __init__(self, config: AppConfig, roles: Mapping[str, str]) -> None:
+        self._config = config
+        self._roles = roles
+        self._models: dict[str, Any] = {}
+
+    def __getitem__(self, role: str) -> Any:
+        model = self._models.get(role)
+        if model is None:
+            model = get_role_model(self._config, self._roles[role])
+            self._models[role] = model
+        return model
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._roles)
+
+    def __len__(self) -> int:
+        return len(self._roles)
+
+
 class ExpertCouncilRunner:
     """Expert council executor for review and verdict workflow."""
 
     def __init__(self, config: AppConfig) -> None:
         self.config = config
-        self.expert_models = {
-            "summarizer": create_chat_model(config.model_for_role("summarizer"), config),
-            "fact_checker": create_chat_model(config.model_for_role("fact_checker"), config),
-            "researcher": create_chat_model(config.model_for_role("researcher"), config),
-            "impact_assessor": create_chat_model(config.model_for_role("impact_assessor"), config),
-            "expert_supervisor": create_chat_model(config.model_for_role("master"), config),
-        }
+        self.expert_models: Mapping[str, Any] = _LazyRoleModels(config, _COUNCIL_MODEL_ROLES)
+        self.batch_reviews = config.council.batch_reviews
+        self.fast_consensus = config.council.fast_consensus
+        self.response_cache_size = config.council.response_cache_size
+        # (role, messages) -> model response, kept across runs of this council
+        self._response_cache: OrderedDict[tuple, Any] = OrderedDict()
+        # Cached prompts already being sent, so concurrent duplicates share one call
+        self._pending_calls: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, dict[tuple, asyncio.Future]
+        ] = weakref.WeakKeyDictionary()
+        self.max_parallel_per_role = config.council.max_parallel_per_role
+        # Semaphores bind to an event loop, and the council runs on more than one
+        self._role_semaphores: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, dict[str, asyncio.Semaphore]
+        ] = weakref.WeakKeyDictionary()
+
+    def _role_semaphore(self, role: str) -> asyncio.Semaphore:
+        """Return the running loop's semaphore limiting concurrent calls for a role."""
+        loop = asyncio.get_running_loop()
+        semaphores = self._role_semaphores.get(loop)
+        if semaphores is None:
+            semaphores = self._role_semaphores[loop] = {}
+        semaphore = semaphores.get(role)
+        if semaphore is None:
+            semaphore = semaphores[role] = asyncio.Semaphore(self.max_parallel_per_role)
+        return semaphore
+
+    def _resolve_models(self, roles: list[str]) -> dict[str, Any]:
+        """Return the chat models for ``roles``, building any not created yet."""
+        return {role: self.expert_models[role] for role in roles}
+
+    async def _call_model(self, role: str, messages: list[dict[str, str]]) -> Any:
+        """Invoke a role's model, honouring ``max_parallel_per_role`` when set."""
+        model = self.expert_models[role]
+        if self.max_parallel_per_role <= 0:
+            return await model.ainvoke(messages)
+        async with self._role_semaphore(role):
+            return await model.ainvoke(messages)
+
+    async def _stream_model(
+        self,
+        role: str,
+        messages: list[dict[str, str]],
+        on_chunk: Callable[[str], None],
+    ) -> str:
+        """Stream a role's reply, passing each text chunk to ``on_chunk``."""
+        model = self.expert_models[role]
+        parts: list[str] = []
+
+        async def consume() -> None:
+            async for chunk in model.astream(messages):
+                text = chunk.content if hasattr(chunk, "content") else str(chunk)
+                if not isinstance(text, str) or not text:
+                    continue
+                parts.append(text)
+                on_chunk(text)
+
+        if self.max_parallel_per_role <= 0:
+            await consume()
+        else:
+            async with self._role_semaphore(role):
+                await consume()
+        return "".join(parts)
+
+    async def _ainvoke(self, role: str, messages: list[dict[str, str]]) -> Any:
+        """Invoke a role's model, reusing responses to identical prompts when enabled.
+
+        With the cache on, identical prompts sent concurrently also share one call.
+        """
+        if self.response_cache_size <= 0:
+            return await self._call_model(role, messages)
+
+        key = (role, tuple((m["role"], m["content"]) for m in messages))
+        cached = self._response_cache.get(key)
+        if cached is not None:
+            self._response_cache.move_to_end(key)
+            return cached
+
+        loop = asyncio.get_running_loop()
+        pending_calls = self._pending_calls.get(loop)
+        if pending_calls is None:
+            pending_calls = self._pending_calls[loop] = {}
+        pending = pending_calls.get(key)
+        if pending is None:
+            pending = pending_calls[key] = asyncio.ensure_future(
+                self._call_model(role, messages)
+            )
+            pending.add_done_callback(lambda _done: pending_calls.pop(key, None))
+
+        # Shield the shared call so one cancelled caller does not cancel the others
+        response = await asyncio.shield(pending)
+        self._response_cache[key] = response
+        if len(self._response_cache) > self.response_cache_size:
+            self._response_cache.popitem(last=False)
+        return response
 
     async def run_council(
         self,
         task: str,
         context: str,
         expert_outputs: dict[str, str],
+        on_chunk: Callable[[str], None] | None = None,
     ) -> str:
-        """Execute expert council workflow."""
+        """Execute expert council workflow.
+
+        ``on_chunk`` receives the chairman synthesis incrementally as it streams.
+        """
+        buf = io.StringIO()
+        async for section in self.stream_council(task, context, expert_outputs, on_chunk):
+            buf.write(section)
+        return buf.getvalue()
+
+    async def stream_council(
+        self,
+        task: str,
+        context: str,
+        expert_outputs: dict[str, str],
+        on_chunk: Callable[[str], None] | None = None,
+    ) -> AsyncIterator[str]:
+        """Execute expert council workflow, yielding report sections as they are ready.
+
+        Joining the yielded sections gives the ``run_council`` report: each report
+        part is followed by a newline except the last, as ``"\n".join`` would.
+        """
         if not expert_outputs:
-            return "未提供专家输出，无法进行交叉评审。"
+            yield "未提供专家输出，无法进行交叉评审。"
+            return
 
-        report_parts = [
-            "# 专家委员会分析报告\n",
-            f"**分析任务**: {task}\n",
-        ]
+        yield "# 专家委员会分析报告\n\n"
+        yield f"**分析任务**: {task}\n\n"
 
         # Stage 1: Independent analysis (provided)
-        report_parts.append("\n---\n## 阶段 1: 独立分析（已提供）\n")
-        missing_experts = [e for e in _EXPECTED_EXPERTS if e not in expert_outputs]
+        stage1 = io.StringIO()
+        stage1.write("\n---\n## 阶段 1: 独立分析（已提供）\n\n")
+        present_experts: list[str] = []
+        missing_experts: list[str] = []
+        for expert in _EXPECTED_EXPERTS:
+            (present_experts if expert in expert_outputs else missing_experts).append(expert)
+
         if missing_experts:
-            report_parts.append(f"缺少专家输出: {', '.join(missing_experts)}\n")
+            stage1.write(f"缺少专家输出: {', '.join(missing_experts)}\n\n")
 
-        for expert in _EXPECTED_EXPERTS:
-            if expert in expert_outputs:
-                output = expert_outputs[expert]
-                preview = output[:500] + "..." if len(output) > 500 else output
-                report_parts.append(f"\n### {expert}\n{preview}\n")
+        for expert in present_experts:
+            output = expert_outputs[expert]
+            preview = _preview(output, _REPORT_PREVIEW_CHARS)
+            stage1.write(f"\n### {expert}\n{preview}\n\n")
+        yield stage1.getvalue()
+
+        # Build every client this run may call before any model call, so a bad model
+        # name or missing key fails the run instead of turning into failed reviews
+        models = self._resolve_models([*present_experts, "expert_supervisor"])
 
         # Stage 2: Cross-review
-        report_parts.append("\n---\n## 阶段 2: 交叉评审\n")
-        reviews, grade_summary = await self._stage2_cross_review(expert_outputs, context)
+        yield "\n---\n## 阶段 2: 交叉评审\n\n"
+        # Every review prompt quotes the same context excerpt, so slice it once
+        short_context = context[:1000]
+        # Rebuttals for the discussed conflicts start while other reviews are pending
+        rebuttals = _RebuttalPipeline(self, _review_pairs(expert_outputs), models)
+        reviews, grade_summary = await self._stage2_cross_review(
+            expert_outputs, short_context, on_review=rebuttals.add
+        )
 
-        report_parts.append("\n### 评审等级汇总\n")
+        average_grades = {
+            reviewee: _calculate_average_grade(grades)
+            for reviewee, grades in grade_summary.items()
+        }
+        stage2 = io.StringIO()
+        stage2.write("\n### 评审等级汇总\n\n")
         for reviewee, grades in grade_summary.items():
-            avg_grade = _calculate_average_grade(grades)
-            report_parts.append(f"- **{reviewee}**: {avg_grade} (来自 {len(grades)} 位评审)\n")
+            stage2.write(
+                f"- **{reviewee}**: {average_grades[reviewee]} (来自 {len(grades)} 位评审)\n\n"
+            )
+        yield stage2.getvalue()
 
         conflicts = self._identify_conflicts(reviews)
 
-        # Stage 3: Consensus discussion
-        report_parts.append("\n---\n## 阶段 3: 共识讨论\n")
+        # Without any C/D grade every average is A or B, so the chairman has nothing
+        # to arbitrate; optionally answer with a deterministic summary instead
+        if self.fast_consensus and not conflicts:
+            yield "\n---\n## 阶段 3: 共识讨论\n\n专家意见基本一致，无需额外讨论\n\n"
+            yield "\n---\n## 阶段 4: 主管综合裁决\n\n"
+            yield _build_consensus_summary(expert_outputs, grade_summary, average_grades)
+            return
+
+        # Stage 3: Consensus discussion (rebuttals were started during Stage 2)
+        # The chairman prompt body only needs Stage 2 results, so build it meanwhile
+        chairman_preamble = self._build_chairman_preamble(
+            task, expert_outputs, average_grades, conflicts
+        )
+
+        yield "\n---\n## 阶段 3: 共识讨论\n\n"
         if conflicts:
-            report_parts.append(f"发现 {len(conflicts)} 个需要讨论的分歧点\n")
-            discussion_results = await self._stage3_consensus_discussion(conflicts)
-            report_parts.append(discussion_results)
+            yield f"发现 {len(conflicts)} 个需要讨论的分歧点\n\n"
+            discussion_results = await rebuttals.collect()
+            yield discussion_results + "\n"
         else:
-            report_parts.append("专家意见基本一致，无需额外讨论\n")
+            yield "专家意见基本一致，无需额外讨论\n\n"
             discussion_results = ""
 
         # Stage 4: Chairman synthesis
-        report_parts.append("\n---\n## 阶段 4: 主管综合裁决\n")
+        yield "\n---\n## 阶段 4: 主管综合裁决\n\n"
         final_synthesis = await self._stage4_chairman_synthesis(
-            task, expert_outputs, grade_summary, conflicts, discussion_results
+            chairman_preamble, discussion_results, on_chunk=on_chunk
         )
-        report_parts.append(final_synthesis)
-
-        return "\n".join(report_parts)
+        yield final_synthesis
 
     async def _stage2_cross_review(
-        self, expert_outputs: dict[str, str], context: str
+        self,
+        expert_outputs: dict[str, str],
+        short_context: str,
+        on_review: Callable[[dict], None] | None = None,
     ) -> tuple[list[dict], dict[str, list[str]]]:
-        """Stage 2: Cross-review between experts."""
+        """Stage 2: Cross-review between experts.
+
+        ``short_context`` is the already-truncated context quoted in each prompt.
+        ``on_review`` is called with each review as soon as it is available.
+        """
+        notify = on_review or _ignore_review
 
         async def do_review(reviewer: str, reviewee: str, focus: str) -> dict:
-            model = self.expert_models[reviewer]
             prompt = generate_cross_review_prompt(
                 reviewer=reviewer,
                 reviewee=reviewee,
-                reviewee_output=expert_outputs.get(reviewee, ""),
-                original_context=context[:1000],
+                reviewee_output=expert_outputs[reviewee],
+                original_context=short_context,
                 review_focus=focus,
             )
             messages = [
-                {"role": "system", "content": EXPERT_DESCRIPTIONS.get(reviewer, "")},
+                _REVIEWER_SYSTEM_MESSAGES[reviewer],
                 {"role": "user", "content": prompt},
             ]
             try:
-                response = await model.ainvoke(messages)
-                return {
+                response = await self._ainvoke(reviewer, messages)
+                result = {
                     "reviewer": reviewer,
                     "reviewee": reviewee,
                     "grade": _extract_grade(response.content),
                     "content": response.content,
                 }
             except Exception as e:
-                return {
-                    "reviewer": reviewer,
-                    "reviewee": reviewee,
-                    "grade": "C",
-                    "content": f"评审失败: {e}",
-                }
+                result = _failed_review(reviewer, reviewee, e)
+            notify(result)
+            return result
 
-        review_tasks = []
-        for reviewee, reviewer_configs in CROSS_REVIEW_MATRIX.items():
-            if reviewee not in expert_outputs:
-                continue
-            for cfg in reviewer_configs:
-                reviewer = cfg["reviewer"]
-                if reviewer in expert_outputs:
-                    review_tasks.append(do_review(reviewer, reviewee, cfg["focus"]))
+        pairs = _review_pairs(expert_outputs)
 
-        results = await asyncio.gather(*review_tasks)
+        if self.batch_reviews:
+            results = await self._batched_reviews(
+                pairs, expert_outputs, short_context, do_review, notify
+            )
+        else:
+            results = await asyncio.gather(
+                *(do_review(reviewer, reviewee, focus) for reviewer, reviewee, focus in pairs)
+            )
 
-        reviews = list(results)
-        grade_summary: dict[str, list[str]] = {}
+        grade_summary: defaultdict[str, list[str]] = defaultdict(list)
         for result in results:
-            reviewee = result["reviewee"]
-            grade_summary.setdefault(reviewee, []).append(result["grade"])
+            grade_summary[result["reviewee"]].append(result["grade"])
 
-        return reviews, grade_summary
+        return results, dict(grade_summary)
 
-    def _identify_conflicts(self, reviews: list[dict]) -> list[dict]:
-        """Identify disagreements requiring discussion."""
-        return [
-            {
-                "topic": f"{r['reviewer']} 对 {r['reviewee']} 的评审",
-                "grade": r.get("grade", "B"),
-                "reviewer": r["reviewer"],
-                "reviewee": r["reviewee"],
-                "content": r.get("content", "")[:300],
-            }
-            for r in reviews
-            if r.get("grade", "B") in ("C", "D")
-        ]
+    async def _batched_reviews(
+        self,
+        pairs: list[tuple[str, str, str]],
+        expert_outputs: dict[str, str],
+        short_context: str,
+        do_review: Callable[[str, str, str], Awaitable[dict]],
+        notify: Callable[[dict], None],
+    ) -> list[dict]:
+        """Run Stage 2 with one LLM call per reviewer, keeping matrix order in results.
+
+        ``do_review`` reports its own results; batch results are passed to ``notify``.
+        """
+        groups: dict[str, list[tuple[str, str]]] = {}
+        for reviewer, reviewee, focus in pairs:
+            groups.setdefault(reviewer, []).append((reviewee, focus))
+
+        async def review_group(reviewer: str, targets: list[tuple[str, str]]) -> list[dict]:
+            if len(targets) == 1:
+                return [await do_review(reviewer, *targets[0])]
+
+            prompt = generate_batch_cross_review_prompt(
+                reviewer=reviewer,
+                targets=[
+                    (reviewee, expert_outputs[reviewee], focus) for reviewee, focus in targets
+                ],
+                original_context=short_context,
+            )
+            messages = [
+                _REVIEWER_SYSTEM_MESSAGES[reviewer],
+                {"role": "user", "content": prompt},
+            ]
+            try:
+                response = await self._ainvoke(reviewer, messages)
+            except Exception as e:
+                failed = [_failed_review(reviewer, reviewee, e) for reviewee, _focus in targets]
+                for result in failed:
+                    notify(result)
+                return failed
+
+            # Non-text replies (e.g. a list of content blocks) carry no batch JSON, so
+            # every target then falls back to its own review below
+            content = response.content
+            payload = _parse_json_payload(content) if isinstance(content, str) else None
+            batch = (payload or {}).get("reviews")
+            if not isinstance(batch, dict):
+                batch = {}
+
+            results = []
+            fallback = []
+            for reviewee, focus in targets:
+                review = batch.get(reviewee)
+                if not isinstance(review, dict):
+                    # Reviewee missing from the batched answer: review it on its own
+                    fallback.append((reviewee, focus))
+                    continue
+                content = _dump_review(review)
+                grade = str(review.get("overall_grade", "")).strip().upper()
+                result = {
+                    "reviewer": reviewer,
+                    "reviewee": reviewee,
+                    "grade": grade if grade in _GRADE_VALUES else _extract_grade(content),
+                    "content": content,
+                }
+                notify(result)
+                results.append(result)
 
-    async def _stage3_consensus_discussion(self, conflicts: list[dict]) -> str:
-        """Stage 3: Consensus discussion for conflicts."""
-        if not conflicts:
-            return "无需讨论"
-
-        discussions = []
-        for conflict in conflicts[:3]:
-            reviewee = conflict["reviewee"]
-            reviewer = conflict["reviewer"]
-            model = self.expert_models.get(reviewee)
-            if not model:
-                continue
+            if fallback:
+                results.extend(await asyncio.gather(
+                    *(do_review(reviewer, reviewee, focus) for reviewee, focus in fallback)
+                ))
+            return results
 
-            prompt = f"""你是 {reviewee}，你的分析被 {reviewer} 评为 {conflict['grade']} 级。
+        grouped = await asyncio.gather(
+            *(review_group(reviewer, targets) for reviewer, targets in groups.items())
+        )
 
-{reviewer} 的评审意见:
-{conflict['content']}
+        by_pair = {
+            (result["reviewer"], result["reviewee"]): result
+            for group in grouped
+            for result in group
+        }
+        return [by_pair[(reviewer, reviewee)] for reviewer, reviewee, _focus in pairs]
 
-请针对这些意见进行回应（200字内）。
-"""
-            try:
-                response = await model.ainvoke([{"role": "user", "content": prompt}])
-                discussions.extend([
-                    f"\n### 分歧: {conflict['topic']}\n",
-                    f"**评审等级**: {conflict['grade']}\n",
-                    f"**{reviewee} 的回应**:\n{response.content}\n",
-                ])
-            except Exception as e:
-                discussions.extend([
-                    f"\n### 分歧: {conflict['topic']}\n",
-                    f"讨论失败: {e}\n",
-                ])
+    def _identify_conflicts(self, reviews: list[dict]) -> list[dict]:
+        """Identify disagreements requiring discussion."""
+        return [_conflict_from_review(r) for r in reviews if _is_conflict(r)]
 
-        return "\n".join(discussions)
+    async def _rebut(self, conflict: dict) -> Any:
+        """Ask the reviewed expert to respond to one conflict."""
+        messages = [{"role": "user", "content": _build_rebuttal_prompt(conflict)}]
+        return await self._ainvoke(conflict["reviewee"], messages)
 
-    async def _stage4_chairman_synthesis(
+    def _build_chairman_preamble(
         self,
         task: str,
         expert_outputs: dict[str, str],
-        grade_summary: dict[str, list[str]],
+        average_grades: dict[str, str],
         conflicts: list[dict],
-        discussion_results: str,
     ) -> str:
-        """Stage 4: Chairman final synthesis."""
-        model = self.expert_models["expert_supervisor"]
-
+        """Build the chairman prompt up to the discussion section."""
         expert_text = "\n\n".join(
-            f"### {name}\n{output[:800]}..." if len(output) > 800 else f"### {name}\n{output}"
+            f"### {name}\n{_preview(output, _CHAIRMAN_PREVIEW_CHARS)}"
             for name, output in expert_outputs.items()
         )
 
         review_text = "\n".join(
-            f"- {reviewee}: 平均等级 {_calculate_average_grade(grades)}"
-            for reviewee, grades in grade_summary.items()
+            f"- {reviewee}: 平均等级 {avg_grade}"
+            for reviewee, avg_grade in average_grades.items()
         )
 
         conflict_text = (
@@ -337,7 +777,7 @@ class ExpertCouncilRunner:
             else "无明显分歧"
         )
 
-        prompt = f"""你是专家委员会主席，需要综合所有专家的分析做最终裁决。
+        return f"""你是专家委员会主席，需要综合所有专家的分析做最终裁决。
 
 ## 原始任务
 {task}
@@ -350,7 +790,16 @@ class ExpertCouncilRunner:
 
 ## 分歧点
 {conflict_text}
+"""
 
+    async def _stage4_chairman_synthesis(
+        self,
+        chairman_preamble: str,
+        discussion_results: str,
+        on_chunk: Callable[[str], None] | None = None,
+    ) -> str:
+        """Stage 4: Chairman final synthesis, streamed to ``on_chunk`` when given."""
+        prompt = f"""{chairman_preamble}
 ## 讨论结果
 {discussion_results or "专家意见一致，未进行讨论"}
 
@@ -360,12 +809,11 @@ class ExpertCouncilRunner:
 """
 
         try:
-            messages = [
-                {"role": "system", "content": _EXPERT_PROMPTS["expert_supervisor"]},
-                {"role": "user", "content": prompt},
-            ]
-            response = await model.ainvoke(messages)
-            return response.content
+            messages = [_CHAIRMAN_SYSTEM_MESSAGE, {"role": "user", "content": prompt}]
+            if on_chunk is None:
+                response = await self._ainvoke("expert_supervisor", messages)
+                return response.content
+            return await self._stream_model("expert_supervisor", messages, on_chunk)
         except Exception as e:
             return f"主管综合失败: {e}"
 
@@ -416,24 +864,38 @@ def _build_missing_output_response(messages: list) -> dict:
     }
 
 
+def _prepare_council_call(
+    state: dict,
+) -> tuple[list, dict[str, Any] | None, dict | None]:
+    """
+    Shared preamble of the sync and async entry points.
+
+    Returns (messages, run_council kwargs, early response); exactly one of the
+    last two is set.
+    """
+    task, context, expert_outputs, messages = _prepare_council_state(state)
+
+    if not messages:
+        return messages, None, {"messages": [AIMessage(content="未提供分析任务")]}
+
+    if not expert_outputs:
+        return messages, None, _build_missing_output_response(messages)
+
+    return messages, {"task": task, "context": context, "expert_outputs": expert_outputs}, None
+
+
 def create_council(config: AppConfig) -> CompiledSubAgent:
     """Create expert council SubAgent."""
     runner = ExpertCouncilRunner(config)
 
     def invoke_fn(state: dict, config_: RunnableConfig | None = None) -> dict:
         """Synchronous invocation."""
-        task, context, expert_outputs, messages = _prepare_council_state(state)
-
-        if not messages:
-            return {"messages": [AIMessage(content="未提供分析任务")]}
-
-        if not expert_outputs:
-            return _build_missing_output_response(messages)
+        messages, council_kwargs, early_response = _prepare_council_call(state)
+        if early_response is not None:
+            return early_response
 
         try:
-            result = asyncio.run(
-                runner.run_council(task=task, context=context, expert_outputs=expert_outputs)
-            )
+            result = _run_coroutine_sync(runner.run_council(**council_kwargs))
         except Exception as e:
             result = f"专家委员会执行失败: {e}"
 
@@ -441,18 +903,12 @@ def create_council(config: AppConfig) -> CompiledSubAgent:
 
     async def ainvoke_fn(state: dict, config_: RunnableConfig | None = None) -> dict:
         """Asynchronous invocation."""
-        task, context, expert_outputs, messages = _prepare_council_state(state)
-
-        if not messages:
-            return {"messages": [AIMessage(content="未提供分析任务")]}
-
-        if not expert_outputs:
-            return _build_missing_output_response(messages)
+        messages, council_kwargs, early_response = _prepare_council_call(state)
+        if early_response is not None:
+            return early_response
 
         try:
-            result = await runner.run_council(
-                task=task, context=context, expert_outputs=expert_outputs
-            )
+            result = await runner.run_council(**council_kwargs)
         except Exception as e:
             result = f"专家委员会执行失败: {e}"
 
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Mapping
 
@@ -37,6 +38,10 @@ class ModelConfig(BaseModel):
         return self.model_dump()
 
 
+# Returned for roles missing from model_map; ModelConfig is frozen, so one instance is shared
+_FALLBACK_MODEL_CONFIG = ModelConfig(model="openai:gpt-4o-mini", temperature=0.0)
+
+
 class FilesystemConfig(BaseModel):
     """Filesystem configuration for persisting agent outputs."""
 
@@ -46,6 +51,20 @@ class FilesystemConfig(BaseModel):
         return self.base_path.expanduser().resolve()
 
 
+class CouncilConfig(BaseModel):
+    """Execution settings for the expert council subagent."""
+
+    # Send one cross-review prompt per reviewer covering all of its reviewees (opt-in:
+    # changes the prompts the experts see and the number of model calls)
+    batch_reviews: bool = False
+    # Skip the chairman call when Stage 2 finds no C/D grades (deterministic summary)
+    fast_consensus: bool = False
+    # Reuse responses to identical council prompts across runs (0 disables the cache)
+    response_cache_size: int = 0
+    # Concurrent model calls allowed per council role (0 means unlimited)
+    max_parallel_per_role: int = 4
+
+
 class AppConfig(BaseModel):
     """Application-wide configuration loaded from the environment."""
 
@@ -61,17 +80,19 @@ class AppConfig(BaseModel):
     brave_api_key: str | None = None
     firecrawl_api_key: str | None = None
     filesystem: FilesystemConfig = Field(default_factory=FilesystemConfig)
+    council: CouncilConfig = Field(default_factory=CouncilConfig)
     model_map: dict[str, ModelConfig] = Field(default_factory=dict)
 
     def model_for_role(
         self, role: str, default: ModelConfig | None = None
     ) -> ModelConfig:
         """Return the configured model for a given role."""
-        if role in self.model_map:
-            return self.model_map[role]
+        model_config = self.model_map.get(role)
+        if model_config is not None:
+            return model_config
         if default is not None:
             return default
-        return ModelConfig(model="openai:gpt-4o-mini", temperature=0.0)
+        return _FALLBACK_MODEL_CONFIG
 
 
 def default_model_map(
@@ -118,6 +139,14 @@ def default_model_map(
     return result
 
 
+@lru_cache(maxsize=1)
+def _load_dotenv_once() -> None:
+    """Read ``.env`` into the process environment on the first settings load only."""
+    # override=False never replaces existing variables, so re-reading the file on
+    # every load_settings call would only repeat the disk I/O and parsing
+    load_dotenv(override=False)
+
+
 def load_settings(
     env: Mapping[str, str] | None = None,
     base_path: str | Path | None = None,
@@ -131,7 +160,7 @@ def load_settings(
         base_path: Override the filesystem base directory.
         model_overrides: Optional mapping to override per-role model config.
     """
-    load_dotenv(override=False)
+    _load_dotenv_once()
     source = env if env is not None else os.environ
 
     fs_base = Path(base_path or source.get(FILESYSTEM_BASE_ENV, "./data"))
@@ -170,20 +199,56 @@ def load_settings(
     )
 
 
+@lru_cache(maxsize=1)
+def get_settings() -> AppConfig:
+    """
+    Return settings loaded from the process environment, cached after first use.
+
+    Call ``get_settings.cache_clear()`` to force a reload.
+    """
+    return load_settings()
+
+
 def create_chat_model(model_config: ModelConfig, app_config: AppConfig) -> Any:
     """
     Create a LangChain ChatModel instance from configuration.
 
     Returns a ChatOpenAI, AzureChatOpenAI, or ChatGoogleGenerativeAI instance
-    depending on the provider specified in model_config.
+    depending on the provider specified in model_config. Instances are cached
+    per model config and provider credentials, so roles and subagents that
+    resolve to the same settings share one client and its connection pool.
     """
+    return _build_chat_model(
+        model_config,
+        app_config.openai_api_key,
+        app_config.azure_openai_api_key,
+        app_config.azure_openai_endpoint,
+        app_config.google_api_key,
+    )
+
+
+# Bounded so configs that stop being used do not keep a client alive forever.
+# lru_cache holds no lock while building, so subagents initialised on several
+# threads construct their clients in parallel.
+@lru_cache(maxsize=32)
+def _build_chat_model(
+    model_config: ModelConfig,
+    openai_api_key: str | None,
+    azure_openai_api_key: str | None,
+    azure_openai_endpoint: str | None,
+    google_api_key: str | None,
+) -> Any:
+    # No http_async_client is passed on purpose: langchain_openai already shares a
+    # cached default httpx pool per base URL, and a module-level AsyncClient would
+    # be bound to whichever event loop first used it (the council runs on both the
+    # caller's loop and its own background loop).
     if model_config.provider == "azure":
         from langchain_openai import AzureChatOpenAI
 
         return AzureChatOpenAI(
             model=model_config.model,
-            azure_endpoint=app_config.azure_openai_endpoint,
-            api_key=app_config.azure_openai_api_key,
+            azure_endpoint=azure_openai_endpoint,
+            api_key=azure_openai_api_key,
             azure_deployment=model_config.deployment,
             api_version="2025-04-01-preview",
             temperature=model_config.temperature,
@@ -195,7 +260,7 @@ def create_chat_model(model_config: ModelConfig, app_config: AppConfig) -> Any:
 
         return ChatGoogleGenerativeAI(
             model=model_config.model,
-            google_api_key=app_config.google_api_key,
+            google_api_key=google_api_key,
             temperature=model_config.temperature,
             max_tokens=model_config.max_tokens,
         )
@@ -204,7 +269,7 @@ def create_chat_model(model_config: ModelConfig, app_config: AppConfig) -> Any:
 
     return ChatOpenAI(
         model=model_config.model,
-        api_key=app_config.openai_api_key,
+        api_key=openai_api_key,
         temperature=model_config.temperature,
         max_tokens=model_config.max_tokens,
     )
@@ -212,10 +277,12 @@ def create_chat_model(model_config: ModelConfig, app_config: AppConfig) -> Any:
 
 __all__ = [
     "AppConfig",
+    "CouncilConfig",
     "FilesystemConfig",
     "ModelConfig",
     "default_model_map",
     "load_settings",
+    "get_settings",
     "create_chat_model",
     "OPENAI_API_KEY_ENV",
     "AZURE_OPENAI_API_KEY_ENV",
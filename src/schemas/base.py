@@ -32,15 +32,7 @@ class Grade(str, Enum):
         """从字符串解析等级"""
         if not s:
             return cls.B  # 默认 B
-        s = s.upper().strip()
-        if s in ("A", "A+", "A-", "优秀", "优"):
-            return cls.A
-        elif s in ("B", "B+", "B-", "良好", "良"):
-            return cls.B
-        elif s in ("C", "C+", "C-", "及格", "中"):
-            return cls.C
-        else:
-            return cls.D
+        return _GRADE_ALIASES.get(s.upper().strip(), cls.D)
     
     @classmethod
     def from_score(cls, score: float) -> "Grade":
@@ -78,6 +70,18 @@ class Grade(str, Enum):
         return descriptions[self]
 
 
+# 等级字符串 -> Grade，from_string 一次字典查找即可；未收录的写法按 D 处理
+_GRADE_ALIASES: Dict[str, Grade] = {
+    alias: grade
+    for grade, aliases in (
+        (Grade.A, ("A", "A+", "A-", "优秀", "优")),
+        (Grade.B, ("B", "B+", "B-", "良好", "良")),
+        (Grade.C, ("C", "C+", "C-", "及格", "中")),
+    )
+    for alias in aliases
+}
+
+
 # 等级类型别名
 GradeType = Literal["A", "B", "C", "D"]
 
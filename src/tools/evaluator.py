@@ -68,6 +68,11 @@ DOMAIN_KEYWORDS = {
 
 GRADE_THRESHOLDS = [(0.7, "A"), (0.5, "B"), (0.3, "C")]
 
+# Patterns compiled once at import instead of per evaluated title
+_CLICKBAIT_RES = tuple(re.compile(p, re.IGNORECASE) for p in CLICKBAIT_PATTERNS)
+_LONG_DIGITS_RE = re.compile(r"\d{8,}")
+_TITLE_DATE_RE = re.compile(r"\d{4}[-/年]\d{1,2}[-/月]\d{1,2}")
+
 
 def _score_to_grade(score: float) -> GradeType:
     """Convert internal score to grade."""
@@ -138,12 +143,12 @@ def evaluate_credibility(url: str, title: str) -> dict[str, Any]:
         flags.append("SUSPICIOUS_DOMAIN")
 
     # URL patterns
-    if re.search(r"\d{8,}", url):
+    if _LONG_DIGITS_RE.search(url):
         score -= 0.1
         flags.append("SUSPICIOUS_URL_PATTERN")
 
     # Clickbait detection
-    clickbait_count = sum(1 for p in CLICKBAIT_PATTERNS if re.search(p, title, re.IGNORECASE))
+    clickbait_count = sum(1 for pattern in _CLICKBAIT_RES if pattern.search(title))
     if clickbait_count > 0:
         score -= min(0.3, clickbait_count * 0.1)
         reasons.append(f"标题包含 {clickbait_count} 个诱导性词汇")
@@ -170,7 +175,7 @@ def evaluate_credibility(url: str, title: str) -> dict[str, Any]:
         score += 0.05
         reasons.append("使用安全连接 (HTTPS)")
 
-    if re.search(r"\d{4}[-/年]\d{1,2}[-/月]\d{1,2}", title):
+    if _TITLE_DATE_RE.search(title):
         score += 0.05
         reasons.append("标题包含日期信息")
 
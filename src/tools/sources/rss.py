@@ -6,6 +6,7 @@ No API key required - fully free.
 
 from __future__ import annotations
 
+import re
 from datetime import datetime, timedelta, timezone
 from typing import Any
 
@@ -13,6 +14,7 @@ from langchain_core.tools import tool
 
 from .base import build_error_result
 
+_HTML_TAG_RE = re.compile(r"<[^>]+>")
 
 # Pre-defined high-quality RSS feeds organized by category
 DEFAULT_FEEDS: dict[str, list[dict[str, str]]] = {
@@ -72,9 +74,7 @@ def _format_rss_result(entry: Any, feed_name: str, feed_url: str) -> dict[str, A
         content = entry.content[0].get("value", "")
 
     # Strip HTML tags for cleaner content (simple approach)
-    import re
-
-    content = re.sub(r"<[^>]+>", "", content)
+    content = _HTML_TAG_RE.sub("", content)
     content = content[:500] + "..." if len(content) > 500 else content
 
     return {
@@ -6,6 +6,7 @@ from .callbacks import (
     get_default_callbacks,
 )
 from .logger import logger, set_verbose
+from .paths import ensure_dir
 from .templates import format_markdown_report, format_simple_output
 from .tracer import (
     EventType,
@@ -24,6 +25,8 @@ __all__ = [
     # Logger
     "logger",
     "set_verbose",
+    # Paths
+    "ensure_dir",
     # Templates
     "format_markdown_report",
     "format_simple_output",
@@ -0,0 +1,22 @@
+"""文件系统路径工具"""
+
+from pathlib import Path
+from typing import Union
+
+
+def ensure_dir(path: Union[str, Path]) -> Path:
+    """
+    确保目录存在（含父目录）。
+    
+    Args:
+        path: 目录路径
+        
+    Returns:
+        目录路径
+    """
+    path = Path(path)
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+__all__ = ["ensure_dir"]
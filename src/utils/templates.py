@@ -1,49 +1,66 @@
 """报告模板和格式化工具"""
 
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional
 
 
-def format_markdown_report(
-    query: str,
-    result: Dict[str, Any],
-    generation_time: Optional[datetime] = None,
-) -> str:
+def extract_report_content(result: Dict[str, Any]) -> Optional[str]:
     """
-    将 Agent 运行结果格式化为 Markdown 报告。
+    提取 Agent 结果中最后一条 AI 消息的内容。
+    
+    结果只需遍历一次，即可同时用于 Markdown 报告和终端预览。
     
     Args:
-        query: 用户查询
         result: Agent 运行结果（包含 messages 等）
-        generation_time: 生成时间
         
     Returns:
-        Markdown 格式的报告
+        最后一条 AI 消息内容；没有 AI 消息时返回 None
     """
-    if generation_time is None:
-        generation_time = datetime.now()
-    
-    # 提取最后一条 AI 消息作为报告内容
     messages = result.get("messages", [])
-    report_content = ""
     
     for msg in reversed(messages):
         if hasattr(msg, "content") and msg.content:
             # 如果是 AIMessage
             if hasattr(msg, "type") and msg.type == "ai":
-                report_content = msg.content
-                break
+                return msg.content
         elif isinstance(msg, dict) and msg.get("role") == "assistant":
             # 如果是字典格式
-            report_content = msg.get("content", "")
-            break
+            return msg.get("content", "")
+    
+    return None
+
+
+def iter_report_sections(
+    query: str,
+    result: Dict[str, Any],
+    generation_time: Optional[datetime] = None,
+    content: Optional[str] = None,
+) -> Iterator[str]:
+    """
+    逐段生成 Markdown 报告（页头、正文、页脚），便于直接流式写入文件。
+    
+    各段直接拼接即为 format_markdown_report 的完整报告。
+    
+    Args:
+        query: 用户查询
+        result: Agent 运行结果（包含 messages 等）
+        generation_time: 生成时间
+        content: 已提取的报告内容；为 None 时从 result 中提取
+        
+    Yields:
+        Markdown 报告片段
+    """
+    if generation_time is None:
+        generation_time = datetime.now()
+    
+    # 提取最后一条 AI 消息作为报告内容
+    report_content = content if content is not None else extract_report_content(result)
     
     # 如果没有找到报告内容，使用默认消息
     if not report_content:
         report_content = "Agent 运行完成，但未生成报告内容。"
     
-    # 构建报告
-    report_lines = [
+    header_lines = [
         "# 热点资讯分析报告",
         "",
         f"**查询**: {query}",
@@ -51,36 +68,60 @@ def format_markdown_report(
         "",
         "---",
         "",
-        report_content,
+    ]
+    footer_lines = [
         "",
         "---",
         "",
         f"*本报告由 AI Agent 自动生成于 {generation_time.strftime('%Y-%m-%d %H:%M:%S')}*",
     ]
     
-    return "\n".join(report_lines)
+    yield "\n".join(header_lines) + "\n"
+    yield report_content
+    yield "\n" + "\n".join(footer_lines)
+
+
+def format_markdown_report(
+    query: str,
+    result: Dict[str, Any],
+    generation_time: Optional[datetime] = None,
+    content: Optional[str] = None,
+) -> str:
+    """
+    将 Agent 运行结果格式化为 Markdown 报告。
+    
+    Args:
+        query: 用户查询
+        result: Agent 运行结果（包含 messages 等）
+        generation_time: 生成时间
+        content: 已提取的报告内容；为 None 时从 result 中提取
+        
+    Returns:
+        Markdown 格式的报告
+    """
+    return "".join(iter_report_sections(query, result, generation_time, content))
 
 
-def format_simple_output(result: Dict[str, Any]) -> str:
+def format_simple_output(
+    result: Dict[str, Any],
+    content: Optional[str] = None,
+) -> str:
     """
     提取 Agent 结果的简单文本输出（用于终端显示）。
     
     Args:
         result: Agent 运行结果
+        content: 已提取的报告内容；为 None 时从 result 中提取
         
     Returns:
         简单的文本输出
     """
-    messages = result.get("messages", [])
-    
-    for msg in reversed(messages):
-        if hasattr(msg, "content") and msg.content:
-            if hasattr(msg, "type") and msg.type == "ai":
-                return msg.content
-        elif isinstance(msg, dict) and msg.get("role") == "assistant":
-            return msg.get("content", "")
+    if content is None:
+        content = extract_report_content(result)
     
-    return "Agent 运行完成，但未生成输出内容。"
+    if content is None:
+        return "Agent 运行完成，但未生成输出内容。"
+    return content
 
 
 def extract_tool_calls(result: Dict[str, Any]) -> List[Dict[str, str]]:
@@ -116,6 +157,8 @@ def extract_tool_calls(result: Dict[str, Any]) -> List[Dict[str, str]]:
 
 
 __all__ = [
+    "extract_report_content",
+    "iter_report_sections",
     "format_markdown_report",
     "format_simple_output",
     "extract_tool_calls",
@@ -0,0 +1,570 @@
+"""Tests for expert council cross-review matrix and helpers."""
+
+import pytest
+
+deepagents = pytest.importorskip("deepagents")
+
+
+def test_review_pairs_match_matrix():
+    """REVIEW_PAIRS should list every (reviewer, reviewee) edge in matrix order."""
+    from src.agent.council import CROSS_REVIEW_MATRIX, REVIEW_PAIRS
+
+    expected = [
+        (edge.reviewer, reviewee)
+        for reviewee, edges in CROSS_REVIEW_MATRIX.items()
+        for edge in edges
+    ]
+    assert [(reviewer, reviewee) for reviewer, reviewee, _, _ in REVIEW_PAIRS] == expected
+
+
+def test_review_pairs_are_unique_and_skip_self_review():
+    """Each (reviewer, reviewee) edge should be reviewed once and never by itself."""
+    from src.agent.council import REVIEW_PAIRS
+
+    keys = [(reviewer, reviewee) for reviewer, reviewee, _, _ in REVIEW_PAIRS]
+    assert len(keys) == len(set(keys))
+    assert all(reviewer != reviewee for reviewer, reviewee in keys)
+
+
+def test_reviewer_to_targets_index():
+    """REVIEWER_TO_TARGETS should map each reviewer to the experts it reviews."""
+    from src.agent.council import REVIEWER_TO_TARGETS
+
+    targets = [reviewee for reviewee, _, _ in REVIEWER_TO_TARGETS["fact_checker"]]
+    assert targets == ["summarizer", "researcher", "impact_assessor"]
+
+    targets = [reviewee for reviewee, _, _ in REVIEWER_TO_TARGETS["summarizer"]]
+    assert targets == ["fact_checker"]
+
+
+def test_cross_review_matrix_is_read_only():
+    """The matrix is shared module state and must not be mutable."""
+    from src.agent.council import CROSS_REVIEW_MATRIX, EXPERT_DESCRIPTIONS
+
+    with pytest.raises(TypeError):
+        CROSS_REVIEW_MATRIX["summarizer"] = ()  # type: ignore[index]
+    with pytest.raises(TypeError):
+        EXPERT_DESCRIPTIONS["summarizer"] = ""  # type: ignore[index]
+
+    for edges in CROSS_REVIEW_MATRIX.values():
+        for edge in edges:
+            assert isinstance(edge.review_types, tuple)
+            with pytest.raises(AttributeError):
+                edge.focus = ""  # type: ignore[misc]
+
+
+def test_cross_review_prompt_matches_format():
+    """Precompiled template rendering should be identical to str.format."""
+    from src.agent.council import EXPERT_DESCRIPTIONS, generate_cross_review_prompt
+    from src.agent.council.matrix import CROSS_REVIEW_PROMPT_TEMPLATE
+
+    prompt = generate_cross_review_prompt(
+        reviewer="fact_checker",
+        reviewee="summarizer",
+        reviewee_output="摘要 {not_a_field}",
+        original_context="原始素材",
+        review_focus="事实是否准确",
+    )
+
+    assert prompt == CROSS_REVIEW_PROMPT_TEMPLATE.format(
+        reviewer_name="fact_checker",
+        reviewee_name="summarizer",
+        reviewer_description=EXPERT_DESCRIPTIONS["fact_checker"],
+        review_focus="事实是否准确",
+        reviewee_output="摘要 {not_a_field}",
+        original_context="原始素材",
+    )
+    assert '"overall_grade": "B"' in prompt
+    assert "{{" not in prompt
+
+
+def test_chairman_prompt_defaults():
+    """Empty issues/conflicts/discussion should fall back to placeholder text."""
+    from src.agent.council import generate_chairman_synthesis_prompt
+
+    prompt = generate_chairman_synthesis_prompt(
+        original_task="分析任务",
+        expert_outputs={"summarizer": "要点"},
+        cross_review_summary="summarizer: A",
+        identified_issues=[],
+        conflicts=[],
+        discussion_results="",
+    )
+
+    assert "### summarizer\n要点" in prompt
+    assert "无重大问题" in prompt
+    assert "无明显分歧" in prompt
+    assert "专家已达成共识" in prompt
+
+
+def test_council_dataclasses_use_slots():
+    """Council records are created per review pair and should not carry a __dict__."""
+    from src.agent.council import DiscussionPoint, ExpertOutput
+
+    output = ExpertOutput(expert_name="summarizer", content="要点")
+    point = DiscussionPoint(topic="分歧", participants=["a", "b"], initial_positions={})
+
+    assert not hasattr(output, "__dict__")
+    assert not hasattr(point, "__dict__")
+    assert output.metadata == {}
+    assert point.remaining_disagreements == []
+
+
+@pytest.mark.parametrize(
+    ("text", "expected"),
+    [
+        ('{"overall_grade": "a", "strengths": []}', "A"),
+        ('{"OVERALL_GRADE" : "D"}', "D"),
+        ('{"overall_grade": "X"} {"overall_grade":"C"}', "C"),
+        ("综合等级：B，整体可信", "B"),
+        ("评审等级: d", "D"),
+        ("没有给出结论", "B"),
+    ],
+)
+def test_extract_grade(text, expected):
+    """_extract_grade should accept JSON and Chinese grade formats."""
+    from src.agent.subagents.council import _extract_grade
+
+    assert _extract_grade(text) == expected
+
+
+def test_run_coroutine_sync_reuses_loop_and_works_inside_running_loop():
+    """Sync council calls share one background loop and tolerate a running loop."""
+    import asyncio
+
+    from src.agent.subagents.council import _run_coroutine_sync
+
+    async def current_loop():
+        return asyncio.get_running_loop()
+
+    first = _run_coroutine_sync(current_loop())
+    second = _run_coroutine_sync(current_loop())
+    assert first is second
+
+    async def nested():
+        return _run_coroutine_sync(current_loop())
+
+    assert asyncio.run(nested()) is first
+
+
+class _FakeResponse:
+    def __init__(self, content):
+        self.content = content
+
+
+class _FakeModel:
+    """Async chat model stand-in that records calls and answers via a callback."""
+
+    def __init__(self, responder):
+        self.responder = responder
+        self.calls = []
+
+    async def ainvoke(self, messages, *args, **kwargs):
+        self.calls.append(messages)
+        return _FakeResponse(self.responder(messages))
+
+
+_EXPERT_OUTPUTS = {
+    "summarizer": "摘要要点",
+    "fact_checker": "核查结论",
+    "researcher": "背景信息",
+    "impact_assessor": "影响评估",
+}
+
+
+def _make_runner(responder, **council_settings):
+    from src.agent.subagents.council import ExpertCouncilRunner
+    from src.config import CouncilConfig, load_settings
+
+    config = load_settings(env={"OPENAI_API_KEY": "sk-test"})
+    config.council = CouncilConfig(**council_settings)
+    runner = ExpertCouncilRunner(config)
+    runner.expert_models = {name: _FakeModel(responder) for name in runner.expert_models}
+    return runner
+
+
+def _batched_responder(messages):
+    import json
+
+    prompt = messages[-1]["content"]
+    if "依次评审以下" in prompt:
+        reviews = {
+            name: {"overall_grade": "A", "issues": []}
+            for name in _EXPERT_OUTPUTS
+            if f"### 评审对象：{name}" in prompt
+        }
+        return "```json\n" + json.dumps({"reviews": reviews}) + "\n```"
+    if "overall_grade" in prompt:
+        return '{"overall_grade": "A"}'
+    return "综合裁决"
+
+
+def test_stage2_batches_reviews_per_reviewer():
+    """Batched Stage 2 should issue one call per reviewer and keep matrix order."""
+    import asyncio
+
+    from src.agent.council import REVIEW_PAIRS
+
+    runner = _make_runner(_batched_responder, batch_reviews=True)
+    reviews, grade_summary = asyncio.run(
+        runner._stage2_cross_review(_EXPERT_OUTPUTS, "原始素材")
+    )
+
+    reviewers = {reviewer for reviewer, _, _, _ in REVIEW_PAIRS}
+    review_calls = sum(len(runner.expert_models[name].calls) for name in reviewers)
+    assert review_calls == len(reviewers)
+    assert [(r["reviewer"], r["reviewee"]) for r in reviews] == [
+        (reviewer, reviewee) for reviewer, reviewee, _, _ in REVIEW_PAIRS
+    ]
+    assert all(grade == "A" for grades in grade_summary.values() for grade in grades)
+
+
+def test_stage2_unbatched_reviews_each_pair():
+    """With batching disabled, every matrix edge gets its own review call."""
+    import asyncio
+
+    from src.agent.council import REVIEW_PAIRS
+
+    runner = _make_runner(_batched_responder, batch_reviews=False)
+    reviews, _ = asyncio.run(runner._stage2_cross_review(_EXPERT_OUTPUTS, "原始素材"))
+
+    total_calls = sum(len(model.calls) for model in runner.expert_models.values())
+    assert total_calls == len(REVIEW_PAIRS)
+    assert len(reviews) == len(REVIEW_PAIRS)
+
+
+def test_batched_review_with_list_content_falls_back_per_review():
+    """A batch reply that is not text should not abort Stage 2."""
+    import asyncio
+
+    from src.agent.council import REVIEW_PAIRS
+
+    def responder(messages):
+        if "依次评审以下" in messages[-1]["content"]:
+            return [{"type": "text", "text": "无法解析的内容块"}]
+        return '{"overall_grade": "A"}'
+
+    runner = _make_runner(responder, batch_reviews=True)
+    reviews, grade_summary = asyncio.run(
+        runner._stage2_cross_review(_EXPERT_OUTPUTS, "原始素材")
+    )
+
+    assert [(r["reviewer"], r["reviewee"]) for r in reviews] == [
+        (reviewer, reviewee) for reviewer, reviewee, _, _ in REVIEW_PAIRS
+    ]
+    assert all(r["grade"] == "A" for r in reviews)
+    assert set(grade_summary) == set(_EXPERT_OUTPUTS)
+
+
+def test_fast_consensus_skips_chairman_when_grades_agree():
+    """With fast_consensus on, unanimous A/B grades should not call the chairman."""
+    import asyncio
+
+    runner = _make_runner(_batched_responder, fast_consensus=True)
+    report = asyncio.run(runner.run_council("任务", "原始素材", dict(_EXPERT_OUTPUTS)))
+
+    assert runner.expert_models["expert_supervisor"].calls == []
+    assert "### 共识结论" in report
+    assert "| summarizer | A |" in report
+
+
+def test_chairman_runs_without_fast_consensus():
+    """The chairman synthesis stays the default path."""
+    import asyncio
+
+    runner = _make_runner(_batched_responder)
+    report = asyncio.run(runner.run_council("任务", "原始素材", dict(_EXPERT_OUTPUTS)))
+
+    assert len(runner.expert_models["expert_supervisor"].calls) == 1
+    assert report.endswith("综合裁决")
+
+
+def test_stream_council_yields_report_sections():
+    """Streamed sections arrive stage by stage and join into the full report."""
+    import asyncio
+
+    async def collect():
+        return [section async for section in runner.stream_council(
+            "任务", "原始素材", dict(_EXPERT_OUTPUTS)
+        )]
+
+    runner = _make_runner(_batched_responder)
+    sections = asyncio.run(collect())
+    report = asyncio.run(_make_runner(_batched_responder).run_council(
+        "任务", "原始素材", dict(_EXPERT_OUTPUTS)
+    ))
+
+    assert sections[0] == "# 专家委员会分析报告\n\n"
+    assert sections[-1] == "综合裁决"
+    assert "".join(sections) == report
+
+
+def test_council_report_keeps_newline_joined_layout():
+    """The report equals the report parts joined with newlines, as it always was."""
+    import asyncio
+
+    from src.agent.council import REVIEW_PAIRS
+
+    def responder(messages):
+        prompt = messages[-1]["content"]
+        if "请针对这些意见进行回应" in prompt:
+            return "回应内容"
+        if "overall_grade" in prompt:
+            return '{"overall_grade": "D"}'
+        return "综合裁决"
+
+    async def collect():
+        return "".join([section async for section in runner.stream_council(
+            "任务", "原始素材", dict(_EXPERT_OUTPUTS)
+        )])
+
+    runner = _make_runner(responder, batch_reviews=False)
+    streamed = asyncio.run(collect())
+    report = asyncio.run(_make_runner(responder, batch_reviews=False).run_council(
+        "任务", "原始素材", dict(_EXPERT_OUTPUTS)
+    ))
+
+    review_counts = {}
+    for _reviewer, reviewee, _, _ in REVIEW_PAIRS:
+        review_counts[reviewee] = review_counts.get(reviewee, 0) + 1
+    discussion = []
+    for reviewer, reviewee, _, _ in REVIEW_PAIRS[:3]:
+        discussion.extend([
+            f"\n### 分歧: {reviewer} 对 {reviewee} 的评审\n",
+            "**评审等级**: D\n",
+            f"**{reviewee} 的回应**:\n回应内容\n",
+        ])
+    expected = "\n".join([
+        "# 专家委员会分析报告\n",
+        "**分析任务**: 任务\n",
+        "\n---\n## 阶段 1: 独立分析（已提供）\n",
+        *(f"\n### {name}\n{output}\n" for name, output in _EXPERT_OUTPUTS.items()),
+        "\n---\n## 阶段 2: 交叉评审\n",
+        "\n### 评审等级汇总\n",
+        *(f"- **{name}**: D (来自 {count} 位评审)\n" for name, count in review_counts.items()),
+        "\n---\n## 阶段 3: 共识讨论\n",
+        f"发现 {len(REVIEW_PAIRS)} 个需要讨论的分歧点\n",
+        "\n".join(discussion),
+        "\n---\n## 阶段 4: 主管综合裁决\n",
+        "综合裁决",
+    ])
+
+    assert report == expected
+    assert streamed == expected
+
+
+def test_collect_rebuttals_reports_failures_in_order():
+    """Concurrent rebuttals keep conflict order and render failures inline."""
+    import asyncio
+
+    from src.agent.subagents.council import _collect_rebuttals
+
+    def responder(messages):
+        if "fact_checker" in messages[-1]["content"].split("，")[0]:
+            raise RuntimeError("限流")
+        return "回应内容"
+
+    runner = _make_runner(responder)
+    conflicts = [
+        {"topic": "第一条", "grade": "C", "reviewer": "researcher",
+         "reviewee": "summarizer", "content": "证据不足"},
+        {"topic": "第二条", "grade": "D", "reviewer": "researcher",
+         "reviewee": "fact_checker", "content": "来源缺失"},
+    ]
+
+    async def scenario():
+        return await _collect_rebuttals(
+            [(conflict, asyncio.ensure_future(runner._rebut(conflict))) for conflict in conflicts]
+        )
+
+    text = asyncio.run(scenario())
+
+    assert text.index("第一条") < text.index("第二条")
+    assert "回应内容" in text
+    assert "讨论失败: 限流" in text
+
+
+def test_rebuttal_pipeline_starts_conflicts_in_matrix_order():
+    """Rebuttals start once earlier reviews have arrived, never out of matrix order."""
+    import asyncio
+
+    from src.agent.subagents.council import _RebuttalPipeline
+
+    runner = _make_runner(lambda messages: "回应内容")
+    pairs = [
+        ("fact_checker", "summarizer", "准确性"),
+        ("researcher", "summarizer", "完整性"),
+        ("summarizer", "fact_checker", "可读性"),
+    ]
+
+    async def scenario():
+        pipeline = _RebuttalPipeline(runner, pairs, runner.expert_models)
+        pipeline.add({"reviewer": "researcher", "reviewee": "summarizer", "grade": "C"})
+        assert pipeline._jobs == []
+
+        pipeline.add({"reviewer": "fact_checker", "reviewee": "summarizer", "grade": "A"})
+        assert [c["reviewer"] for c, _ in pipeline._jobs] == ["researcher"]
+        return await pipeline.collect()
+
+    text = asyncio.run(scenario())
+    assert "researcher 对 summarizer 的评审" in text
+    assert "回应内容" in text
+
+
+def test_response_cache_reuses_identical_prompts():
+    """With the response cache on, a repeated Stage 2 run makes no new model calls."""
+    import asyncio
+
+    runner = _make_runner(_batched_responder, response_cache_size=32)
+    first, _ = asyncio.run(runner._stage2_cross_review(_EXPERT_OUTPUTS, "原始素材"))
+    calls = sum(len(model.calls) for model in runner.expert_models.values())
+
+    second, _ = asyncio.run(runner._stage2_cross_review(_EXPERT_OUTPUTS, "原始素材"))
+
+    assert sum(len(model.calls) for model in runner.expert_models.values()) == calls
+    assert second == first
+
+
+def test_response_cache_shares_concurrent_identical_calls():
+    """Identical prompts in flight at the same time should reach the model once."""
+    import asyncio
+
+    runner = _make_runner(_batched_responder, response_cache_size=32)
+    messages = [{"role": "user", "content": "综合裁决"}]
+
+    async def run():
+        return await asyncio.gather(
+            *(runner._ainvoke("expert_supervisor", messages) for _ in range(3))
+        )
+
+    responses = asyncio.run(run())
+
+    assert len(runner.expert_models["expert_supervisor"].calls) == 1
+    assert {response.content for response in responses} == {"综合裁决"}
+
+
+def test_response_cache_is_off_by_default():
+    """Without configuration every run queries the models again."""
+    import asyncio
+
+    runner = _make_runner(_batched_responder)
+    asyncio.run(runner._stage2_cross_review(_EXPERT_OUTPUTS, "原始素材"))
+    calls = sum(len(model.calls) for model in runner.expert_models.values())
+    asyncio.run(runner._stage2_cross_review(_EXPERT_OUTPUTS, "原始素材"))
+
+    assert sum(len(model.calls) for model in runner.expert_models.values()) == 2 * calls
+
+
+def test_dump_review_matches_stdlib_json():
+    """Batched review content keeps the stdlib pretty-printed layout."""
+    import json
+
+    from src.agent.subagents.council import _dump_review
+
+    review = {"overall_grade": "B", "issues": ["来源不足"], "score": 3.5, "extra": {}}
+    assert _dump_review(review) == json.dumps(review, ensure_ascii=False, indent=2)
+
+
+def test_expert_models_are_built_on_first_use(monkeypatch):
+    """The runner should only create chat models for roles it actually calls."""
+    from src.agent.subagents import council
+    from src.config import load_settings
+
+    built = []
+    monkeypatch.setattr(
+        council, "get_role_model", lambda config, role: built.append(role) or object()
+    )
+
+    runner = council.ExpertCouncilRunner(load_settings(env={"OPENAI_API_KEY": "sk-test"}))
+    assert built == []
+    assert set(runner.expert_models) == {
+        "summarizer", "fact_checker", "researcher", "impact_assessor", "expert_supervisor"
+    }
+
+    first = runner.expert_models["expert_supervisor"]
+    assert runner.expert_models["expert_supervisor"] is first
+    assert built == ["master"]
+
+
+def test_model_construction_failure_fails_the_run(monkeypatch):
+    """A role model that cannot be built should fail the council, not invent reviews."""
+    import asyncio
+
+    from src.agent.subagents import council
+    from src.config import load_settings
+
+    fake = _FakeModel(_batched_responder)
+
+    def get_role_model(config, role):
+        if role == "master":
+            raise ValueError("unknown model")
+        return fake
+
+    monkeypatch.setattr(council, "get_role_model", get_role_model)
+    runner = council.ExpertCouncilRunner(load_settings(env={"OPENAI_API_KEY": "sk-test"}))
+
+    with pytest.raises(ValueError, match="unknown model"):
+        asyncio.run(runner.run_council("任务", "原始素材", dict(_EXPERT_OUTPUTS)))
+    assert fake.calls == []
+
+
+@pytest.mark.parametrize(
+    ("grades", "expected"),
+    [
+        ([], "B"),
+        (["A", "B"], "A"),
+        (["A", "C"], "B"),
+        (["B", "C"], "B"),
+        (["C", "D"], "C"),
+        (["D", "D", "C"], "D"),
+        (["X"], "B"),
+    ],
+)
+def test_calculate_average_grade_boundaries(grades, expected):
+    """Half-grade averages round up, unknown grades count as B."""
+    from src.agent.subagents.council import _calculate_average_grade
+
+    assert _calculate_average_grade(grades) == expected
+
+
+def test_max_parallel_per_role_limits_concurrent_calls():
+    """A role never has more in-flight model calls than max_parallel_per_role."""
+    import asyncio
+
+    class _SlowModel:
+        def __init__(self):
+            self.active = 0
+            self.peak = 0
+
+        async def ainvoke(self, messages, *args, **kwargs):
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+            await asyncio.sleep(0.01)
+            self.active -= 1
+            return _FakeResponse('{"overall_grade": "A"}')
+
+    runner = _make_runner(_batched_responder, batch_reviews=False, max_parallel_per_role=1)
+    runner.expert_models = {name: _SlowModel() for name in runner.expert_models}
+    asyncio.run(runner._stage2_cross_review(_EXPERT_OUTPUTS, "原始素材"))
+
+    assert runner.expert_models["fact_checker"].peak == 1
+
+
+def test_chairman_synthesis_streams_to_callback():
+    """With on_chunk, Stage 4 streams the chairman reply and returns the full text."""
+    import asyncio
+
+    class _StreamingModel:
+        async def astream(self, messages, *args, **kwargs):
+            for piece in ("## 裁决", "\n结论", "一致"):
+                yield _FakeResponse(piece)
+
+    runner = _make_runner(_batched_responder)
+    runner.expert_models = {**runner.expert_models, "expert_supervisor": _StreamingModel()}
+    chunks = []
+    text = asyncio.run(
+        runner._stage4_chairman_synthesis("前文", "", on_chunk=chunks.append)
+    )
+
+    assert chunks == ["## 裁决", "\n结论", "一致"]
+    assert text == "".join(chunks)
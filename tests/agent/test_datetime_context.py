@@ -1,6 +1,6 @@
 """Tests for datetime context injection."""
 
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
 
 import pytest
 
@@ -63,6 +63,17 @@ def test_format_datetime_different_weekdays():
     assert "星期五" in context
 
 
+def test_format_datetime_context_keeps_time_zones_apart():
+    """Equal instants in different time zones format their own wall-clock time."""
+    from src.agent.master import format_datetime_context
+
+    utc_dt = datetime(2024, 12, 15, 6, 30, 0, tzinfo=timezone.utc)
+    cst_dt = utc_dt.astimezone(timezone(timedelta(hours=8)))
+
+    assert "06:30:00" in format_datetime_context(utc_dt)
+    assert "14:30:00" in format_datetime_context(cst_dt)
+
+
 def test_create_agent_with_datetime(skip_if_no_api_key):
     """Test that agent can be created with custom datetime."""
     from src.agent import create_news_agent
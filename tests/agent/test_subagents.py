@@ -237,3 +237,36 @@ def test_subagent_prompt_quality():
         # impact_assessor should mention impact/influence
         if name == "impact_assessor":
             assert "影响" in prompt or "impact" in prompt.lower()
+
+
+def test_structured_runnable_awaits_model_on_ainvoke():
+    """Async invocation should use the model's ainvoke instead of a worker thread."""
+    import asyncio
+
+    from langchain_core.messages import HumanMessage
+    from pydantic import BaseModel
+
+    from src.agent.subagents.base import create_structured_runnable
+
+    class Output(BaseModel):
+        mode: str
+
+    class StructuredModel:
+        def invoke(self, messages, config=None):
+            return Output(mode="sync")
+
+        async def ainvoke(self, messages, config=None):
+            assert messages[0] == {"role": "system", "content": "系统提示"}
+            return Output(mode="async")
+
+    class Model:
+        def with_structured_output(self, schema):
+            return StructuredModel()
+
+    runnable = create_structured_runnable(Model(), Output, "系统提示")
+    state = {"messages": [HumanMessage(content="任务")]}
+
+    result = asyncio.run(runnable.ainvoke(state))
+
+    assert '"mode": "async"' in result["messages"][-1].content
+    assert '"mode": "sync"' in runnable.invoke(state)["messages"][-1].content
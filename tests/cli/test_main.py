@@ -53,12 +53,31 @@ class TestCLIArgumentParsing:
             args = parse_args()
             assert args.model == 'gpt-4o'
 
+    def test_import_is_lightweight(self):
+        """测试导入 CLI 模块不会加载 Agent 依赖"""
+        import subprocess
+        import sys
+
+        result = subprocess.run(
+            [
+                sys.executable,
+                "-c",
+                "import sys, cli.main; "
+                "assert 'src.agent' not in sys.modules; "
+                "assert 'langchain_core' not in sys.modules",
+            ],
+            capture_output=True,
+            text=True,
+        )
+
+        assert result.returncode == 0, result.stderr
+
 
 class TestRunAgent:
     """测试 Agent 运行功能"""
     
-    @patch('cli.main.load_settings')
-    @patch('cli.main.create_news_agent')
+    @patch('src.config.get_settings')
+    @patch('src.agent.create_news_agent')
     def test_run_agent_basic(self, mock_create_agent, mock_load_settings):
         """测试基本的 Agent 运行"""
         from cli.main import run_agent
@@ -86,8 +105,8 @@ class TestRunAgent:
         mock_create_agent.assert_called_once_with(config=mock_config)
         mock_agent.invoke.assert_called_once()
     
-    @patch('cli.main.load_settings')
-    @patch('cli.main.create_news_agent')
+    @patch('src.config.get_settings')
+    @patch('src.agent.create_news_agent')
     def test_run_agent_with_domain(self, mock_create_agent, mock_load_settings):
         """测试带领域的 Agent 运行"""
         from cli.main import run_agent
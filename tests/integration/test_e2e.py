@@ -159,8 +159,8 @@ class TestCLIIntegration:
         except ImportError as e:
             pytest.fail(f"CLI 模块导入失败: {e}")
     
-    @patch('cli.main.create_news_agent')
-    @patch('cli.main.load_settings')
+    @patch('src.agent.create_news_agent')
+    @patch('src.config.get_settings')
     def test_cli_run_agent_integration(self, mock_load_settings, mock_create_agent):
         """测试 CLI 的 Agent 运行集成"""
         from cli.main import run_agent
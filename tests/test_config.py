@@ -12,6 +12,7 @@ from src.config import (
     ModelConfig,
     default_model_map,
     load_settings,
+    get_settings,
     create_chat_model,
 )
 
@@ -60,6 +61,7 @@ def test_model_overrides_do_not_mutate_defaults():
     fallback = ModelConfig(model="openai:gpt-4o-mini", temperature=0.0)
     assert settings.model_for_role("unknown", default=fallback) is fallback
     assert settings.model_for_role("unknown").model == "openai:gpt-4o-mini"
+    assert settings.model_for_role("unknown") is settings.model_for_role("other")
 
 
 def test_filesystem_base_can_be_overridden(tmp_path):
@@ -85,6 +87,22 @@ def test_load_settings_with_openai_key():
     assert settings.model_map["master"].provider == "openai"
 
 
+def test_get_settings_is_cached(monkeypatch, tmp_path):
+    monkeypatch.setenv(FILESYSTEM_BASE_ENV, str(tmp_path / "first"))
+    get_settings.cache_clear()
+    try:
+        settings = get_settings()
+        monkeypatch.setenv(FILESYSTEM_BASE_ENV, str(tmp_path / "second"))
+
+        assert get_settings() is settings
+        assert settings.filesystem.base_path == tmp_path / "first"
+
+        get_settings.cache_clear()
+        assert get_settings().filesystem.base_path == tmp_path / "second"
+    finally:
+        get_settings.cache_clear()
+
+
 def test_create_chat_model_openai(monkeypatch):
     monkeypatch.setenv(OPENAI_API_KEY_ENV, "sk-test")
     
@@ -118,3 +136,48 @@ def test_create_chat_model_azure(monkeypatch):
     except Exception:
         # 如果没有网络或真实 key，跳过
         pass
+
+
+def test_create_chat_model_reuses_clients(monkeypatch):
+    import sys
+    import types
+
+    from src import config as config_module
+
+    class FakeChatOpenAI:
+        def __init__(self, **kwargs):
+            self.kwargs = kwargs
+
+    monkeypatch.setitem(
+        sys.modules, "langchain_openai", types.SimpleNamespace(ChatOpenAI=FakeChatOpenAI)
+    )
+    config_module._build_chat_model.cache_clear()
+    try:
+        app_config = load_settings(env={OPENAI_API_KEY_ENV: "sk-test"})
+        config = ModelConfig(model="gpt-4o-mini", provider="openai", temperature=0.0)
+
+        model = create_chat_model(config, app_config)
+        assert isinstance(model, FakeChatOpenAI)
+        assert create_chat_model(config.model_copy(), app_config) is model
+
+        # 温度或密钥不同则使用独立的客户端
+        warmer = ModelConfig(model="gpt-4o-mini", provider="openai", temperature=0.5)
+        assert create_chat_model(warmer, app_config) is not model
+        other_key = load_settings(env={OPENAI_API_KEY_ENV: "sk-other"})
+        assert create_chat_model(config, other_key) is not model
+    finally:
+        config_module._build_chat_model.cache_clear()
+
+
+def test_load_settings_reads_dotenv_once(monkeypatch):
+    from src import config as config_module
+
+    calls = []
+    monkeypatch.setattr(config_module, "load_dotenv", lambda **kwargs: calls.append(kwargs))
+    config_module._load_dotenv_once.cache_clear()
+    try:
+        load_settings(env={})
+        load_settings(env={})
+        assert calls == [{"override": False}]
+    finally:
+        config_module._load_dotenv_once.cache_clear()
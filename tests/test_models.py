@@ -78,3 +78,13 @@ def test_score_breakdown_default_from_dict():
     assert scores.credibility is None
     assert scores.relevance is None
     assert scores.quality is None
+
+
+def test_grade_from_string_aliases():
+    from src.schemas.base import Grade
+
+    assert Grade.from_string(" a+ ") is Grade.A
+    assert Grade.from_string("良好") is Grade.B
+    assert Grade.from_string("c-") is Grade.C
+    assert Grade.from_string("不及格") is Grade.D
+    assert Grade.from_string("") is Grade.B
@@ -0,0 +1,37 @@
+"""路径工具测试"""
+
+from pathlib import Path
+
+
+def test_ensure_dir_creates_nested_directories(tmp_path):
+    """测试递归创建目录"""
+    from src.utils.paths import ensure_dir
+    
+    target = tmp_path / "reports" / "daily"
+    result = ensure_dir(target)
+    
+    assert result == target
+    assert target.is_dir()
+
+
+def test_ensure_dir_accepts_str_and_is_idempotent(tmp_path):
+    """测试字符串路径与重复调用"""
+    from src.utils.paths import ensure_dir
+    
+    target = str(tmp_path / "checkpoints")
+    
+    assert ensure_dir(target) == Path(target)
+    assert ensure_dir(target) == Path(target)
+    assert Path(target).is_dir()
+
+
+def test_ensure_dir_recreates_removed_directory(tmp_path):
+    """测试目录被删除后再次调用会重新创建"""
+    from src.utils.paths import ensure_dir
+    
+    target = tmp_path / "traces"
+    ensure_dir(target)
+    target.rmdir()
+    
+    ensure_dir(target)
+    assert target.is_dir()
@@ -142,6 +142,58 @@ class TestFormatSimpleOutput:
         assert "未生成输出内容" in output or "Agent 运行完成" in output
 
 
+class TestIterReportSections:
+    """测试报告分段生成"""
+    
+    def test_sections_join_to_full_report(self):
+        """测试各段拼接结果与完整报告一致"""
+        from src.utils.templates import format_markdown_report, iter_report_sections
+        
+        result = {"messages": [MagicMock(type="ai", content="报告正文")]}
+        generation_time = datetime(2024, 1, 1, 12, 0, 0)
+        
+        sections = list(iter_report_sections("查询", result, generation_time))
+        
+        assert len(sections) == 3
+        assert sections[1] == "报告正文"
+        assert "".join(sections) == format_markdown_report("查询", result, generation_time)
+
+
+class TestExtractReportContent:
+    """测试报告内容提取"""
+    
+    def test_extract_last_ai_message(self):
+        """测试提取最后一条 AI 消息"""
+        from src.utils.templates import extract_report_content
+        
+        result = {
+            "messages": [
+                MagicMock(type="ai", content="第一条"),
+                MagicMock(type="user", content="追问"),
+                MagicMock(type="ai", content="最后一条"),
+            ]
+        }
+        
+        assert extract_report_content(result) == "最后一条"
+    
+    def test_no_ai_message(self):
+        """测试没有 AI 消息时返回 None"""
+        from src.utils.templates import extract_report_content
+        
+        assert extract_report_content({"messages": []}) is None
+    
+    def test_precomputed_content_is_reused(self):
+        """测试传入已提取内容时不再遍历消息"""
+        from src.utils.templates import format_markdown_report, format_simple_output
+        
+        result = {"messages": [MagicMock(type="ai", content="原始内容")]}
+        
+        report = format_markdown_report("查询", result, content="预提取内容")
+        assert "预提取内容" in report
+        assert "原始内容" not in report
+        assert format_simple_output(result, content="预提取内容") == "预提取内容"
+
+
 class TestExtractToolCalls:
     """测试工具调用提取"""
     